@@ -26,6 +26,7 @@ class BaseAPIManager:
         self.session = requests.Session()
         self.session.timeout = 10
         self.last_error: Optional[str] = None
+        self._data_version = 0
     
     def get_data(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
@@ -52,6 +53,7 @@ class BaseAPIManager:
             # Cache the fresh data
             self.cache.set(self.cache_key, fresh_data)
             self.last_error = None
+            self._data_version += 1
             
             return fresh_data
             
@@ -84,10 +86,35 @@ class BaseAPIManager:
         """
         raise NotImplementedError("Subclasses must implement _fetch_data method")
     
+    def get_version(self) -> int:
+        """
+        Get the data version counter.
+
+        The counter increments every time fresh data is cached, so
+        callers can cheaply detect whether data changed since they
+        last looked without comparing the data itself.
+
+        Returns:
+            Monotonically increasing version number
+        """
+        return self._data_version
+
     def clear_cache(self) -> None:
         """Clear cached data for this API."""
         self.cache.clear(self.cache_key)
     
+    def get_data_age(self) -> Optional[float]:
+        """
+        Get the age of the cached data in seconds.
+
+        Cheaper than get_cache_info() for callers that poll the age
+        every frame: no dict is built and no expiry check runs.
+
+        Returns:
+            Age in seconds, or None if no data is cached
+        """
+        return self.cache.get_age(self.cache_key)
+
     def get_cache_info(self) -> Dict[str, Any]:
         """
         Get cache information for this API.
@@ -4,11 +4,27 @@ Weather API management for OpenWeatherMap integration with mock data support.
 
 import time
 import random
+from collections import namedtuple
 from typing import Dict, Any
 from api.base_api import BaseAPIManager
 from utils.constants import API_ENDPOINTS, WEATHER_ICONS, MOCK_WEATHER_DATA
 from config.config_manager import ConfigManager
 
+# The 16 compass points; the degree->point conversion works in integer
+# tenths of a degree (22.5° == 225 tenths, half-sector 11.25° == 112)
+# so it stays off the FPU and the power-of-two modulo becomes a mask
+_COMPASS = ('N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
+            'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW')
+
+# Immutable per-refresh view of the weather data; attribute access is a
+# slot lookup rather than a dict hash, which matters for the fields the
+# screen reads every frame
+WeatherSnapshot = namedtuple('WeatherSnapshot', [
+    'data', 'status', 'city', 'country', 'temperature_formatted',
+    'condition', 'icon', 'humidity', 'pressure', 'visibility',
+    'wind_speed_formatted', 'data_source_info', 'last_updated'
+])
+
 
 class WeatherAPIManager(BaseAPIManager):
     """Manages weather data from OpenWeatherMap API with mock data fallback."""
@@ -24,6 +40,11 @@ class WeatherAPIManager(BaseAPIManager):
         self.config = config_manager
         self._mock_data_index = 0
         self._last_mock_change = time.time()
+
+        # Derived view of the weather data, rebuilt only when the data
+        # version or status changes (see snapshot())
+        self._snapshot = None
+        self._snapshot_version = -1
     
     def _fetch_data(self) -> Dict[str, Any]:
         """
@@ -115,18 +136,18 @@ class WeatherAPIManager(BaseAPIManager):
             self._mock_data_index = (self._mock_data_index + 1) % len(MOCK_WEATHER_DATA)
             self._last_mock_change = current_time
         
-        # Get base mock data
-        mock_data = MOCK_WEATHER_DATA[self._mock_data_index].copy()
-        
+        # Get base mock data (immutable sample, no copy needed)
+        mock_data = MOCK_WEATHER_DATA[self._mock_data_index]
+
         # Add some configuration-based customization
         city = self.config.get('weather.city', 'Demo City,UK')
         units = self.config.get('weather.units', 'metric')
-        
+
         # Allow customization via environment variables
-        temperature = float(self.config.get('weather.mock_temperature', mock_data['temperature']))
-        condition = self.config.get('weather.mock_condition', mock_data['condition'])
-        humidity = int(self.config.get('weather.mock_humidity', mock_data['humidity']))
-        wind_speed = float(self.config.get('weather.mock_wind_speed', mock_data['wind_speed']))
+        temperature = float(self.config.get('weather.mock_temperature', mock_data.temperature))
+        condition = self.config.get('weather.mock_condition', mock_data.condition)
+        humidity = int(self.config.get('weather.mock_humidity', mock_data.humidity))
+        wind_speed = float(self.config.get('weather.mock_wind_speed', mock_data.wind_speed))
         
         # Add some random variation to make it more realistic
         temp_variation = random.uniform(-1.5, 1.5)
@@ -169,6 +190,48 @@ class WeatherAPIManager(BaseAPIManager):
         """
         return WEATHER_ICONS.get(condition, '🌤️')
     
+    def snapshot(self) -> WeatherSnapshot:
+        """
+        Get a precomputed view of the current weather data.
+
+        Folds the per-field accessors (temperature, icon, wind, data
+        source) into one immutable snapshot that is rebuilt only when
+        fresh data lands or the status changes, so callers drawing
+        every frame do a single method call instead of eight.
+
+        Returns:
+            WeatherSnapshot with formatted weather fields and the raw data
+        """
+        data = self.get_data()
+        status = data.get('status', 'unknown')
+
+        if (self._snapshot is not None
+                and self._snapshot_version == self._data_version
+                and self._snapshot.status == status):
+            return self._snapshot
+
+        units = data.get('units', 'metric')
+        speed_unit = 'm/s' if units == 'metric' else 'mph'
+        is_mock = data.get('data_source') == 'mock_data'
+
+        self._snapshot = WeatherSnapshot(
+            data=data,
+            status=status,
+            city=data.get('city', 'Unknown'),
+            country=data.get('country', ''),
+            temperature_formatted=data.get('temperature_formatted', '0°C'),
+            condition=data.get('condition', 'Unknown'),
+            icon=data.get('icon', '🌤️'),
+            humidity=data.get('humidity', 0),
+            pressure=data.get('pressure', 0),
+            visibility=data.get('visibility', 0),
+            wind_speed_formatted=f"{data.get('wind_speed', 0):.1f} {speed_unit}",
+            data_source_info="🧪 Mock Weather Data" if is_mock else "🌐 OpenWeatherMap API",
+            last_updated=data.get('last_updated', 0)
+        )
+        self._snapshot_version = self._data_version
+        return self._snapshot
+
     def is_using_mock_data(self) -> bool:
         """
         Check if currently using mock data.
@@ -241,10 +304,12 @@ class WeatherAPIManager(BaseAPIManager):
         data = self.get_data()
         units = data.get('units', 'metric')
         speed_unit = 'm/s' if units == 'metric' else 'mph'
-        
+        direction = data.get('wind_direction', 0)
+
         return {
             'speed': data.get('wind_speed', 0),
-            'direction': data.get('wind_direction', 0),
+            'direction': direction,
+            'direction_compass': _COMPASS[((int(direction * 10) + 112) // 225) & 15],
             'speed_formatted': f"{data.get('wind_speed', 0):.1f} {speed_unit}"
         }
     
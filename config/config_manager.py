@@ -40,7 +40,11 @@ class ConfigManager:
         
         # Load configuration (env vars take precedence over JSON)
         self.config = self._load_config()
-        
+
+        # Bumped on every mutation; lets callers cache values derived
+        # from the config and detect staleness with one compare
+        self.version = 0
+
         print(f"Configuration loaded from: {self._get_config_sources()}")
     
     def _load_env_file(self) -> None:
@@ -274,6 +278,7 @@ class ConfigManager:
         
         # Set the value
         config[keys[-1]] = value
+        self.version += 1
     
     def get_section(self, section: str) -> Dict[str, Any]:
         """
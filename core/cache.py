@@ -4,117 +4,205 @@ Thread-safe data caching for API responses and application data.
 
 import threading
 import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 
+# Number of independent stripes the cache is sharded into. Power of two
+# so the shard index reduces to a mask of the key hash.
+SHARD_COUNT = 16
+
 
 class DataCache:
-    """Thread-safe data cache for API responses and application data."""
-    
-    def __init__(self):
-        """Initialize the data cache with thread-safe operations."""
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._lock = threading.Lock()
-    
+    """Thread-safe data cache for API responses and application data.
+
+    The cache is sharded into SHARD_COUNT independent stripes, each
+    with its own lock, so writers touching different keys never
+    contend. Within a stripe, readers use a seqlock-style protocol:
+    writers bump the stripe's version counter to an odd value before
+    mutating and back to even after, so a reader can do its lookup
+    without taking the lock and just retry on the rare occasion a
+    write to the same stripe was in flight. Reads are the hot path
+    (every frame polls ages and freshness), writes happen a few times
+    a minute per API.
+
+    Each stripe is a bounded LRU: entries beyond its share of maxsize
+    evict oldest-first, so the cache cannot grow without limit on a
+    long-running dashboard.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        """
+        Initialize the data cache with thread-safe operations.
+
+        Args:
+            maxsize: Soft bound on total entries, split across stripes
+        """
+        self._shards = [OrderedDict() for _ in range(SHARD_COUNT)]
+        self._locks = [threading.Lock() for _ in range(SHARD_COUNT)]
+        # Per-stripe counters: even while stable, odd during a write
+        self._versions = [0] * SHARD_COUNT
+        self._shard_maxsize = max(1, maxsize // SHARD_COUNT)
+
+    @staticmethod
+    def _shard(key: str) -> int:
+        """Map a key to its stripe index."""
+        return hash(key) & (SHARD_COUNT - 1)
+
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """
         Get cached data.
-        
+
         Args:
             key: Cache key
-            
+
         Returns:
             Cached data or None if not found
         """
-        with self._lock:
-            cache_entry = self._cache.get(key)
-            return cache_entry.get('data') if cache_entry else None
-    
+        i = self._shard(key)
+        versions = self._versions
+        shard = self._shards[i]
+        while True:
+            v1 = versions[i]
+            if v1 & 1:
+                continue
+            cache_entry = shard.get(key)
+            if versions[i] == v1:
+                if cache_entry is None:
+                    return None
+                # Record recency for LRU eviction. Membership doesn't
+                # change, so no version bump is needed and concurrent
+                # unlocked lookups stay safe
+                with self._locks[i]:
+                    if key in shard:
+                        shard.move_to_end(key)
+                return cache_entry[0]
+
     def set(self, key: str, data: Dict[str, Any]) -> None:
         """
         Set cached data with timestamp.
-        
+
         Args:
             key: Cache key
             data: Data to cache
         """
-        with self._lock:
-            self._cache[key] = {
-                'data': data,
-                'timestamp': time.time()
-            }
-    
+        # (data, timestamp) tuple: one lookup hands back both fields,
+        # and the monotonic clock is immune to wall-clock jumps
+        entry = (data, time.monotonic())
+        i = self._shard(key)
+        shard = self._shards[i]
+        with self._locks[i]:
+            self._versions[i] += 1
+            existed = key in shard
+            shard[key] = entry
+            if existed:
+                shard.move_to_end(key)
+            elif len(shard) > self._shard_maxsize:
+                shard.popitem(last=False)
+            self._versions[i] += 1
+
     def is_expired(self, key: str, max_age: int) -> bool:
         """
         Check if cached data is expired.
-        
+
         Args:
             key: Cache key
             max_age: Maximum age in seconds
-            
+
         Returns:
             True if expired or not found, False otherwise
         """
-        with self._lock:
-            if key not in self._cache:
-                return True
-            return time.time() - self._cache[key]['timestamp'] > max_age
-    
+        i = self._shard(key)
+        versions = self._versions
+        shard = self._shards[i]
+        while True:
+            v1 = versions[i]
+            if v1 & 1:
+                continue
+            cache_entry = shard.get(key)
+            if versions[i] == v1:
+                if cache_entry is None:
+                    return True
+                return time.monotonic() - cache_entry[1] > max_age
+
     def clear(self, key: str = None) -> None:
         """
         Clear cached data.
-        
+
         Args:
             key: Specific key to clear, or None to clear all
         """
-        with self._lock:
-            if key:
-                self._cache.pop(key, None)
-            else:
-                self._cache.clear()
-    
+        if key:
+            i = self._shard(key)
+            with self._locks[i]:
+                self._versions[i] += 1
+                self._shards[i].pop(key, None)
+                self._versions[i] += 1
+            return
+
+        # Full clear: take the stripes one at a time in index order so
+        # concurrent full clears cannot deadlock
+        for i in range(SHARD_COUNT):
+            with self._locks[i]:
+                self._versions[i] += 1
+                self._shards[i].clear()
+                self._versions[i] += 1
+
     def get_age(self, key: str) -> Optional[float]:
         """
         Get age of cached data in seconds.
-        
+
         Args:
             key: Cache key
-            
+
         Returns:
             Age in seconds or None if not found
         """
-        with self._lock:
-            if key not in self._cache:
-                return None
-            return time.time() - self._cache[key]['timestamp']
-    
+        i = self._shard(key)
+        versions = self._versions
+        shard = self._shards[i]
+        while True:
+            v1 = versions[i]
+            if v1 & 1:
+                continue
+            cache_entry = shard.get(key)
+            if versions[i] == v1:
+                if cache_entry is None:
+                    return None
+                return time.monotonic() - cache_entry[1]
+
     def get_all_keys(self) -> list:
         """
         Get all cache keys.
-        
+
         Returns:
             List of cache keys
         """
-        with self._lock:
-            return list(self._cache.keys())
-    
+        keys = []
+        for i in range(SHARD_COUNT):
+            with self._locks[i]:
+                keys.extend(self._shards[i].keys())
+        return keys
+
     def get_cache_info(self) -> Dict[str, Any]:
         """
         Get cache statistics and information.
-        
+
         Returns:
             Dictionary with cache information
         """
-        with self._lock:
-            current_time = time.time()
-            info = {
-                'total_entries': len(self._cache),
-                'entries': {}
-            }
-            
-            for key, entry in self._cache.items():
-                info['entries'][key] = {
-                    'age_seconds': current_time - entry['timestamp'],
-                    'size_bytes': len(str(entry['data']))
-                }
-            
-            return info 
\ No newline at end of file
+        current_time = time.monotonic()
+        info = {
+            'total_entries': 0,
+            'entries': {}
+        }
+
+        for i in range(SHARD_COUNT):
+            with self._locks[i]:
+                info['total_entries'] += len(self._shards[i])
+                for key, (data, timestamp) in self._shards[i].items():
+                    info['entries'][key] = {
+                        'age_seconds': current_time - timestamp,
+                        'size_bytes': len(str(data))
+                    }
+
+        return info
@@ -13,6 +13,7 @@ from typing import List, Optional
 from config.config_manager import ConfigManager
 from core.touch_handler import TouchHandler
 from utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT, get_runtime_constants
+from utils.system_monitor import SystemMonitor
 
 # Import API managers
 from api.bitcoin_api import BitcoinAPIManager
@@ -168,13 +169,26 @@ class DashboardApp:
                     pygame.display.quit()
                     pygame.display.init()
                 
-                # Try to create display
-                self.screen = pygame.display.set_mode(
-                    (SCREEN_WIDTH, SCREEN_HEIGHT), 
-                    method['mode']
-                )
-                
-                print(f"Display initialized successfully using {method['description']}")
+                # Try to create display; prefer the SDL2 hardware
+                # renderer with vsync (SCALED routes blits through the
+                # GPU and vsync paces the frame loop), falling back to
+                # the plain software surface where unsupported
+                try:
+                    self.screen = pygame.display.set_mode(
+                        (SCREEN_WIDTH, SCREEN_HEIGHT),
+                        method['mode'] | pygame.SCALED,
+                        vsync=1
+                    )
+                    self.vsync_enabled = True
+                except (pygame.error, TypeError):
+                    self.screen = pygame.display.set_mode(
+                        (SCREEN_WIDTH, SCREEN_HEIGHT),
+                        method['mode']
+                    )
+                    self.vsync_enabled = False
+
+                print(f"Display initialized successfully using {method['description']}"
+                      f"{' (vsync)' if self.vsync_enabled else ''}")
                 break
                 
             except pygame.error as e:
@@ -223,11 +237,17 @@ class DashboardApp:
     def _start_background_updates(self) -> None:
         """Start background thread for periodic API updates."""
         self.update_thread = threading.Thread(
-            target=self._background_update_loop, 
+            target=self._background_update_loop,
             daemon=True
         )
         self.update_thread.start()
         print("Background update thread started")
+
+        # System stats are collected off the UI thread too; screens
+        # read the published snapshot instead of polling synchronously
+        SystemMonitor.start_collector(
+            interval=self.runtime_config['SYSTEM_UPDATE_INTERVAL']
+        )
     
     def _background_update_loop(self) -> None:
         """Background thread loop for updating API data."""
@@ -478,16 +498,24 @@ class DashboardApp:
         """Draw the current screen and UI elements."""
         if not self.screens:
             return
-        
-        # Draw current screen
+
+        # Draw current screen; screens return None for a full repaint,
+        # a list of dirty rects for a partial update, or an empty list
+        # when nothing changed and the previous frame is still valid
         current_screen = self.screens[self.current_screen_index]
-        current_screen.draw(self.screen)
-        
+        dirty_rects = current_screen.draw(self.screen)
+
+        if dirty_rects is not None and len(dirty_rects) == 0:
+            return
+
         # Draw screen navigation indicators
         self._draw_screen_indicators()
-        
+
         # Update display
-        pygame.display.flip()
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
     
     def _draw_screen_indicators(self) -> None:
         """Draw screen navigation indicators at bottom of screen."""
@@ -5,6 +5,10 @@ Touch input and gesture recognition for the Raspberry Pi Dashboard.
 import time
 from typing import Tuple, Optional, Dict, Any
 
+# Indexed by (vertical_axis << 1) | (delta > 0), so classification is a
+# table lookup instead of a branch per direction
+_SWIPE_DIRECTIONS = ('swipe_left', 'swipe_right', 'swipe_up', 'swipe_down')
+
 
 class TouchHandler:
     """Handle touch input and swipe gesture detection with configurable parameters."""
@@ -67,33 +71,35 @@ class TouchHandler:
         
         Args:
             pos: Touch end position (x, y)
-            
+
         Returns:
-            Swipe direction ('swipe_left', 'swipe_right') or None
+            Swipe direction ('swipe_left', 'swipe_right', 'swipe_up',
+            'swipe_down') or None
         """
         if not self.touch_start or not self.is_touching or not self.touch_start_time:
             self._reset_touch()
             return None
-        
+
         # Calculate swipe parameters
         dx = pos[0] - self.touch_start[0]
         dy = pos[1] - self.touch_start[1]
         dt = time.time() - self.touch_start_time
-        distance = (dx**2 + dy**2)**0.5
-        
+
         # Debug logging if enabled
         if self.config_manager and self.config_manager.get('app.debug_mode', False):
-            print(f"Touch end at {pos}, dx={dx}, dy={dy}, dt={dt:.2f}s, distance={distance:.1f}")
-        
-        # Reset touch state
+            print(f"Touch end at {pos}, dx={dx}, dy={dy}, dt={dt:.2f}s")
+
+        # Classify along the dominant axis: pick the larger component,
+        # gate on threshold and duration, then look the direction up by
+        # axis and sign instead of branching per direction
         swipe_result = None
-        
-        # Check for valid horizontal swipe
-        if self._is_valid_swipe(dx, dy, dt):
-            swipe_result = 'swipe_right' if dx > 0 else 'swipe_left'
+        vertical = abs(dx) < abs(dy)
+        delta = dy if vertical else dx
+        if abs(delta) >= self.swipe_threshold and dt <= self.max_swipe_time:
+            swipe_result = _SWIPE_DIRECTIONS[(vertical << 1) | (delta > 0)]
             if self.config_manager and self.config_manager.get('app.debug_mode', False):
                 print(f"Detected {swipe_result}")
-        
+
         self._reset_touch()
         return swipe_result
     
@@ -121,32 +127,6 @@ class TouchHandler:
             'touch_duration': time.time() - self.touch_start_time if self.touch_start_time else 0
         }
     
-    def _is_valid_swipe(self, dx: float, dy: float, dt: float) -> bool:
-        """
-        Check if movement qualifies as a valid swipe.
-        
-        Args:
-            dx: Horizontal distance
-            dy: Vertical distance  
-            dt: Time duration
-            
-        Returns:
-            True if valid swipe, False otherwise
-        """
-        # Check minimum distance
-        if abs(dx) < self.swipe_threshold:
-            return False
-        
-        # Check time constraint
-        if dt > self.max_swipe_time:
-            return False
-        
-        # Check if predominantly horizontal
-        if abs(dx) < abs(dy) * self.min_swipe_ratio:
-            return False
-        
-        return True
-    
     def _reset_touch(self) -> None:
         """Reset touch state."""
         self.touch_start = None
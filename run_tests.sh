@@ -87,6 +87,20 @@ case $COMMAND in
         print_status "Generating test reports..."
         python test_runner.py --report-only
         ;;
+
+    "perf")
+        print_status "Profiling test durations..."
+        # Surface the slowest tests/fixtures; anything near 500ms is a
+        # candidate for a wider fixture scope or a cheaper stub
+        python -m pytest tests/ --durations=25 --durations-min=0.05
+        if python -c "import pyinstrument" 2>/dev/null; then
+            mkdir -p test_reports
+            python -m pyinstrument -r html -o test_reports/pyinstrument.html -m pytest tests/ -q
+            print_success "Profile written to test_reports/pyinstrument.html"
+        else
+            print_warning "pyinstrument not installed; skipping HTML profile (pip install pyinstrument)"
+        fi
+        ;;
     
     "install-deps")
         print_status "Installing test dependencies..."
@@ -107,6 +121,7 @@ case $COMMAND in
         echo "  screens     - Run only screen tests"
         echo "  validate    - Validate application structure only"
         echo "  report      - Generate test coverage reports"
+        echo "  perf        - Profile test durations (and pyinstrument if installed)"
         echo "  install-deps - Install test dependencies"
         echo "  help        - Show this help message"
         echo ""
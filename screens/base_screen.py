@@ -3,16 +3,36 @@ Base screen class for the Raspberry Pi Dashboard.
 """
 
 import pygame
-from typing import Tuple, Any
+from collections import OrderedDict
+from typing import Tuple, Any, Optional
 from utils.constants import (
-    BLACK, WHITE, STATUS_COLORS, 
-    FONT_LARGE, FONT_MEDIUM, FONT_SMALL
+    BLACK, WHITE, STATUS_COLORS,
+    FONT_LARGE, FONT_MEDIUM, FONT_SMALL,
+    SCREEN_WIDTH, SCREEN_HEIGHT
 )
 
 
 class BaseScreen:
     """Base class for all dashboard screens."""
-    
+
+    # Shared cache of pre-rendered status indicator discs keyed by
+    # (color, radius). Rendering the disc once and blitting it avoids
+    # pygame.draw.circle's per-frame CPU scanline fill.
+    _indicator_cache = {}
+
+    # Shared LRU cache of rendered text surfaces keyed by (text, font
+    # id, color). Dashboard text is highly repetitive (labels, clock
+    # digits, cached API values), so reusing surfaces removes font
+    # shaping and rasterization from the frame loop entirely.
+    _text_cache = OrderedDict()
+    _TEXT_CACHE_MAX_ENTRIES = 256
+
+    # Shared fonts keyed by point size. Constructing a Font loads and
+    # parses the face each time, and a fresh instance also changes the
+    # id(font) part of the text-cache key, so per-call construction
+    # defeated the surface cache for sized titles.
+    _font_cache = {}
+
     def __init__(self, app):
         """
         Initialize base screen.
@@ -22,6 +42,11 @@ class BaseScreen:
         """
         self.app = app
         self.name = self.__class__.__name__
+
+        # Display dimensions are fixed for the 3.5" panel; caching them
+        # avoids per-frame get_width()/get_height() calls into SDL
+        self.screen_width = SCREEN_WIDTH
+        self.screen_height = SCREEN_HEIGHT
         
         # Initialize fonts
         self.font_large = pygame.font.Font(None, FONT_LARGE)
@@ -31,16 +56,50 @@ class BaseScreen:
         # Screen state
         self.is_active = False
         self.last_update = 0
-        
+
+        # Update-rate governance: screens early-exit update() when
+        # called faster than their content can change
+        self.target_fps = 30
+        self._frame_interval = 1.0 / self.target_fps
+
+        # Dirty-rect state: screens compare a per-frame signature of
+        # their visible state against the previous frame and skip the
+        # repaint entirely when nothing changed
+        self._needs_full_repaint = True
+        self._last_frame_signature = None
+
     def activate(self) -> None:
         """Called when screen becomes active."""
         self.is_active = True
+        self._needs_full_repaint = True
         print(f"Activated screen: {self.name}")
     
     def deactivate(self) -> None:
         """Called when screen becomes inactive."""
         self.is_active = False
     
+    def set_target_fps(self, fps: int) -> None:
+        """
+        Set the rate at which this screen wants update() to do work.
+
+        Args:
+            fps: Target updates per second (0 disables throttling)
+        """
+        self.target_fps = fps
+        self._frame_interval = 1.0 / fps if fps > 0 else 0.0
+
+    def _should_update(self, current_time: float) -> bool:
+        """
+        Check whether enough time has passed since the last update.
+
+        Args:
+            current_time: Current timestamp (time.time())
+
+        Returns:
+            True if update work should run this frame
+        """
+        return current_time - self.last_update >= self._frame_interval
+
     def update(self) -> None:
         """
         Update screen data and state.
@@ -48,23 +107,114 @@ class BaseScreen:
         """
         pass
     
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface) -> Optional[list]:
         """
         Draw screen content.
         Must be implemented by subclasses.
-        
+
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            None for a full repaint, a list of dirty pygame.Rects to
+            update only those regions, or an empty list when nothing
+            changed and the display can be left as-is
         """
         screen.fill(BLACK)
         self.draw_title(screen, "Base Screen", 30)
+        return None
+
+    @classmethod
+    def _get_font(cls, size: int) -> pygame.font.Font:
+        """
+        Get a shared default font of the given size.
+
+        Args:
+            size: Font point size
+
+        Returns:
+            Cached font instance for the size
+        """
+        font = cls._font_cache.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            cls._font_cache[size] = font
+        return font
+
+    def _frame_changed(self, signature: Any) -> bool:
+        """
+        Check whether the screen needs repainting this frame.
+
+        Compares a hashable signature of the visible state against the
+        previous frame; the first frame after activation always counts
+        as changed.
+
+        Args:
+            signature: Hashable snapshot of the state that affects
+                what this screen draws
+
+        Returns:
+            True if the screen should repaint, False if the previous
+            frame is still valid
+        """
+        if self._needs_full_repaint or signature != self._last_frame_signature:
+            self._last_frame_signature = signature
+            self._needs_full_repaint = False
+            return True
+        return False
     
-    def draw_text(self, screen: pygame.Surface, text: str, pos: Tuple[int, int], 
-                  font: pygame.font.Font, color: Tuple[int, int, int] = WHITE, 
-                  center: bool = False) -> pygame.Rect:
+    def _render_text(self, text: str, font: pygame.font.Font,
+                     color: Tuple[int, int, int],
+                     antialias: bool = True) -> pygame.Surface:
+        """
+        Render text and match it to the display pixel format.
+
+        font.render produces a 32-bit alpha surface; converting it once
+        here turns every later blit into a plain copy instead of a
+        per-pixel format conversion inside SDL.
+
+        Args:
+            text: Text to render
+            font: Font to use
+            color: Text color (RGB tuple)
+            antialias: Whether to anti-alias the glyphs (skipping it is
+                noticeably cheaper for small labels)
+
+        Returns:
+            Rendered text surface
+        """
+        text = str(text)
+        cache_key = (text, id(font), color, antialias)
+        text_surface = self._text_cache.get(cache_key)
+        if text_surface is not None:
+            self._text_cache.move_to_end(cache_key)
+            return text_surface
+
+        text_surface = font.render(text, antialias, color)
+        try:
+            text_surface = text_surface.convert_alpha()
+        except pygame.error:
+            # No display surface yet (e.g. headless test runs)
+            pass
+
+        # Evict the least recently used entry to keep the cache bounded;
+        # static labels stay hot while one-off strings age out
+        if len(self._text_cache) >= self._TEXT_CACHE_MAX_ENTRIES:
+            self._text_cache.popitem(last=False)
+        self._text_cache[cache_key] = text_surface
+
+        return text_surface
+
+    def draw_text(self, screen: pygame.Surface, text: str, pos: Tuple[int, int],
+                  font: pygame.font.Font, color: Tuple[int, int, int] = WHITE,
+                  center: bool = False, antialias: bool = True) -> None:
         """
         Helper method to draw text on screen.
-        
+
+        Almost no callers need the drawn rectangle, so this returns None
+        and skips the Rect allocation; use draw_text_rect when the
+        rectangle is actually needed.
+
         Args:
             screen: Pygame surface to draw on
             text: Text to draw
@@ -72,19 +222,42 @@ class BaseScreen:
             font: Font to use
             color: Text color (RGB tuple)
             center: Whether to center text at position
-            
+            antialias: Whether to anti-alias the glyphs
+        """
+        text_surface = self._render_text(text, font, color, antialias)
+
+        if center:
+            screen.blit(text_surface, text_surface.get_rect(center=pos))
+        else:
+            screen.blit(text_surface, pos)
+
+    def draw_text_rect(self, screen: pygame.Surface, text: str, pos: Tuple[int, int],
+                       font: pygame.font.Font, color: Tuple[int, int, int] = WHITE,
+                       center: bool = False) -> pygame.Rect:
+        """
+        Draw text and return the rectangle it was drawn into.
+
+        Args:
+            screen: Pygame surface to draw on
+            text: Text to draw
+            pos: Position (x, y)
+            font: Font to use
+            color: Text color (RGB tuple)
+            center: Whether to center text at position
+
         Returns:
             Rectangle of drawn text
         """
-        text_surface = font.render(str(text), True, color)
-        
+        text_surface = self._render_text(text, font, color)
+
         if center:
             text_rect = text_surface.get_rect(center=pos)
-            screen.blit(text_surface, text_rect)
-            return text_rect
         else:
-            screen.blit(text_surface, pos)
-            return pygame.Rect(pos[0], pos[1], text_surface.get_width(), text_surface.get_height())
+            text_rect = pygame.Rect(pos[0], pos[1], text_surface.get_width(),
+                                    text_surface.get_height())
+
+        screen.blit(text_surface, text_rect)
+        return text_rect
     
     def draw_title(self, screen: pygame.Surface, title: str, y_pos: int, size: int = None) -> None:
         """
@@ -96,11 +269,11 @@ class BaseScreen:
             y_pos: Y position for title
             size: Optional font size (uses medium font by default)
         """
-        screen_width = screen.get_width()
-        
+        screen_width = self.screen_width
+
         # Choose font based on size parameter
         if size is not None:
-            font = pygame.font.Font(None, size)
+            font = self._get_font(size)
         else:
             font = self.font_medium
             
@@ -119,7 +292,16 @@ class BaseScreen:
             radius: Circle radius
         """
         color = STATUS_COLORS.get(status, STATUS_COLORS['unknown'])
-        pygame.draw.circle(screen, color, pos, radius)
+
+        # Blit a pre-rendered disc instead of drawing a circle each frame
+        cache_key = (color, radius)
+        disc = self._indicator_cache.get(cache_key)
+        if disc is None:
+            disc = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(disc, color, (radius, radius), radius)
+            self._indicator_cache[cache_key] = disc
+
+        screen.blit(disc, (pos[0] - radius, pos[1] - radius))
     
     def draw_progress_bar(self, screen: pygame.Surface, pos: Tuple[int, int], 
                          size: Tuple[int, int], value: float, max_value: float = 100,
@@ -139,14 +321,15 @@ class BaseScreen:
         """
         x, y = pos
         width, height = size
-        
-        # Draw background
-        pygame.draw.rect(screen, bg_color, (x, y, width, height))
-        
+
+        # Draw background (Surface.fill uses SDL's accelerated fill path,
+        # unlike pygame.draw.rect which fills on the CPU)
+        screen.fill(bg_color, (x, y, width, height))
+
         # Draw fill
         fill_width = int((value / max_value) * width) if max_value > 0 else 0
         if fill_width > 0:
-            pygame.draw.rect(screen, fill_color, (x, y, fill_width, height))
+            screen.fill(fill_color, (x, y, fill_width, height))
         
         # Draw border
         pygame.draw.rect(screen, WHITE, (x, y, width, height), 1)
@@ -162,8 +345,7 @@ class BaseScreen:
         Returns:
             Y position for centered content
         """
-        screen_height = screen.get_height()
-        return (screen_height - content_height) // 2
+        return (self.screen_height - content_height) // 2
     
     def get_wrapped_text(self, text: str, font: pygame.font.Font, 
                         max_width: int) -> list:
@@ -213,9 +395,9 @@ class BaseScreen:
             y_pos: Y position (default: center of screen)
         """
         if y_pos is None:
-            y_pos = screen.get_height() // 2
-        
-        screen_width = screen.get_width()
+            y_pos = self.screen_height // 2
+
+        screen_width = self.screen_width
         
         # Draw error title
         self.draw_text(screen, "Error", (screen_width // 2, y_pos), 
@@ -2,13 +2,20 @@
 Clock and Calendar screen for the Raspberry Pi Dashboard.
 """
 
+import pygame
+import threading
 import time
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from screens.base_screen import BaseScreen
 from api.calendar_api import CalendarAPIManager
 from utils.constants import WHITE, GREEN, GRAY, SCREEN_WIDTH
 
+# Weekday names indexed by datetime.weekday(); avoids strftime('%A')
+# going through the C locale machinery every second
+_WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday',
+             'Friday', 'Saturday', 'Sunday')
+
 
 class ClockCalendarScreen(BaseScreen):
     """Display current time, date, and upcoming calendar events."""
@@ -24,94 +31,213 @@ class ClockCalendarScreen(BaseScreen):
         self.calendar_manager = CalendarAPIManager(app.config_manager)
         self.last_calendar_update = 0
         self.calendar_update_interval = 300  # 5 minutes
+
+        # Only seconds are visible, so 1 Hz update work is enough
+        self.set_target_fps(1)
+
+        # Worker thread for calendar refreshes so the HTTPS round-trip
+        # never blocks the render loop; the thread publishes results
+        # through the API manager's thread-safe cache
+        self._refresh_thread = None
+
+        # Composite surface of the event list, rebuilt only when the
+        # calendar manager reports a new data version
+        self._events_surface = None
+        self._last_events_version = -1
+
+        # Formatted time strings only change once per second, so cache
+        # them keyed by the whole second instead of re-running strftime
+        # (and re-rendering the text) every frame
+        self._last_second = None
+        self._time_str = ''
+        self._date_str = ''
+        self._day_str = ''
+
+        # datetime.now() costs a gettimeofday plus object construction;
+        # derive the datetime from a single time.time() read and only
+        # rebuild it when the whole second changes
+        self._cached_dt = None
+        self._cached_dt_second = -1
+
+    def _current_datetime(self, now_f: float) -> datetime:
+        """
+        Get the current datetime, rebuilt at most once per second.
+
+        Args:
+            now_f: Current epoch time from time.time()
+
+        Returns:
+            datetime for the current second
+        """
+        sec = int(now_f)
+        if sec != self._cached_dt_second:
+            self._cached_dt = datetime.fromtimestamp(now_f)
+            self._cached_dt_second = sec
+        return self._cached_dt
         
     def update(self) -> None:
         """Update screen data (calendar events are updated via background thread)."""
         current_time = time.time()
-        
-        # Update calendar data periodically
+
+        # Throttle update work to the screen's target rate
+        if not self._should_update(current_time):
+            return
+
+        # Update calendar data periodically; the actual fetch runs on a
+        # worker thread so update() returns immediately
         if current_time - self.last_calendar_update > self.calendar_update_interval:
             if self.calendar_manager.is_configured():
-                try:
-                    # Force refresh calendar data
-                    self.calendar_manager.get_data(force_refresh=True)
-                except Exception as e:
-                    print(f"Error updating calendar: {e}")
+                self._start_calendar_refresh()
             self.last_calendar_update = current_time
-        
+
         self.last_update = current_time
+
+    def _start_calendar_refresh(self) -> None:
+        """Kick off a background calendar refresh if none is running."""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+
+        def _refresh():
+            try:
+                # Force refresh calendar data
+                self.calendar_manager.get_data(force_refresh=True)
+            except Exception as e:
+                print(f"Error updating calendar: {e}")
+
+        self._refresh_thread = threading.Thread(target=_refresh, daemon=True)
+        self._refresh_thread.start()
     
-    def draw(self, screen) -> None:
+    def draw(self, screen) -> Optional[list]:
         """
         Draw clock and calendar screen.
-        
+
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            None when the screen repainted, an empty list when nothing
+            visible changed since the previous frame
         """
+        # Skip the repaint entirely if neither the clock second nor the
+        # calendar data changed since the last frame; between second
+        # ticks this returns zero dirty rects and the frame costs a
+        # couple of comparisons
+        now = self._current_datetime(time.time())
+        signature = (self._cached_dt_second,
+                     self.calendar_manager.get_version(),
+                     self.calendar_manager.is_configured())
+        if not self._frame_changed(signature):
+            return []
+
         screen.fill((0, 0, 0))  # Black background
-        
-        # Get current time and date
-        now = datetime.now()
-        time_str = now.strftime('%H:%M:%S')
-        date_str = now.strftime('%d/%m/%Y')
-        day_str = now.strftime('%A')
-        
+
+        # Only reformat the time strings when the second rolls over (the
+        # rendered surfaces themselves come from the text cache)
+        current_second = (now.hour, now.minute, now.second, now.day)
+        if current_second != self._last_second:
+            # Direct integer formatting is much cheaper than strftime,
+            # which round-trips through the C locale machinery
+            self._time_str = f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+            self._date_str = f"{now.day:02d}/{now.month:02d}/{now.year}"
+            self._day_str = _WEEKDAYS[now.weekday()]
+            self._last_second = current_second
+
         # Draw time (large, centered)
-        self.draw_text(screen, time_str, (SCREEN_WIDTH // 2, 80), 
+        self.draw_text(screen, self._time_str, (SCREEN_WIDTH // 2, 80),
                       self.font_large, WHITE, center=True)
-        
+
         # Draw date
-        self.draw_text(screen, date_str, (SCREEN_WIDTH // 2, 130), 
+        self.draw_text(screen, self._date_str, (SCREEN_WIDTH // 2, 130),
                       self.font_medium, WHITE, center=True)
-        
+
         # Draw day of week
-        self.draw_text(screen, day_str, (SCREEN_WIDTH // 2, 155), 
+        self.draw_text(screen, self._day_str, (SCREEN_WIDTH // 2, 155),
                       self.font_small, GRAY, center=True)
         
         # Draw calendar events
         self._draw_calendar_events(screen)
-        
+
         # Draw status indicator
         self._draw_calendar_status(screen)
+
+        return None
     
     def _draw_calendar_events(self, screen) -> None:
         """
         Draw upcoming calendar events.
-        
+
+        The event area is composited once per calendar data version and
+        blitted from cache on every other frame.
+
         Args:
             screen: Pygame surface to draw on
         """
         y_offset = 185
-        
+
         if not self.calendar_manager.is_configured():
-            self.draw_text(screen, "Google Calendar not configured", 
+            self.draw_text(screen, "Google Calendar not configured",
                           (20, y_offset), self.font_small, GRAY)
             return
-        
+
+        version = self.calendar_manager.get_version()
+        if self._events_surface is None or version != self._last_events_version:
+            self._events_surface = self._build_events_surface()
+            self._last_events_version = version
+
+        screen.blit(self._events_surface, (0, y_offset))
+
+    def _build_events_surface(self) -> 'pygame.Surface':
+        """
+        Render the upcoming events area onto a composite surface.
+
+        Returns:
+            Surface containing the rendered event list
+        """
+        surface = pygame.Surface((SCREEN_WIDTH, 140))
+        y_offset = 0
+
         try:
             events = self.calendar_manager.get_upcoming_events(max_results=3)
-            
+
             if events:
                 # Title
-                self.draw_text(screen, "Upcoming Events:", (20, y_offset), 
+                self.draw_text(surface, "Upcoming Events:", (20, y_offset),
                               self.font_medium, GREEN)
                 y_offset += 30
-                
+
                 # Draw events
                 for event in events:
-                    self._draw_single_event(screen, event, y_offset)
+                    self._draw_single_event(surface, event, y_offset)
                     y_offset += 25
-                    
+
                     # Stop if we're running out of space
-                    if y_offset > 280:
+                    if y_offset > 95:
                         break
             else:
-                self.draw_text(screen, "No upcoming events", (20, y_offset), 
+                self.draw_text(surface, "No upcoming events", (20, y_offset),
                               self.font_medium, GRAY)
         except Exception as e:
-            self.draw_text(screen, f"Calendar error: {str(e)[:30]}...", 
+            self.draw_text(surface, f"Calendar error: {str(e)[:30]}...",
                           (20, y_offset), self.font_small, (255, 100, 100))
+
+        return surface
     
+    @staticmethod
+    def _truncate_title(title: str, max_length: int = 35) -> str:
+        """
+        Truncate a title at a word boundary.
+
+        Args:
+            title: Event title
+            max_length: Maximum length before truncation kicks in
+
+        Returns:
+            The title, shortened at the last word boundary that fits
+        """
+        if len(title) <= max_length:
+            return title
+        return title[:max_length - 3].rsplit(' ', 1)[0] + '…'
+
     def _draw_single_event(self, screen, event: Dict[str, Any], y_pos: int) -> None:
         """
         Draw a single calendar event.
@@ -121,29 +247,38 @@ class ClockCalendarScreen(BaseScreen):
             event: Event data dictionary
             y_pos: Y position to draw at
         """
-        # Format event text
-        title = event.get('title', 'No title')
-        time_str = event.get('time', '')
-        date_str = event.get('date', '')
-        
-        # Truncate title if too long
-        max_title_length = 35
-        if len(title) > max_title_length:
-            title = title[:max_title_length - 3] + "..."
-        
-        # Create event line
-        if event.get('is_all_day'):
-            event_text = f"{date_str} - {title}"
-        else:
-            event_text = f"{date_str} {time_str} - {title}"
-        
+        # The formatted line only depends on the event data, so build it
+        # once per fetched event and stash it on the event dict; later
+        # frames reuse the cached string instead of re-slicing and
+        # re-concatenating at frame rate
+        event_text = event.get('_display_line')
+        if event_text is None:
+            time_str = event.get('time', '')
+            date_str = event.get('date', '')
+
+            # Truncate at a word boundary and remember the result on the
+            # event so later frames skip the slicing entirely
+            title = event.get('_title_trunc')
+            if title is None:
+                title = self._truncate_title(event.get('title', 'No title'))
+                event['_title_trunc'] = title
+
+            # Create event line
+            if event.get('is_all_day'):
+                event_text = f"{date_str} - {title}"
+            else:
+                event_text = f"{date_str} {time_str} - {title}"
+
+            location = event.get('location', '')
+            event['_display_line'] = event_text
+            event['_display_loc'] = f"  @ {location}" if location and len(location) < 30 else ''
+
         # Draw event
         self.draw_text(screen, event_text, (25, y_pos), self.font_small, WHITE)
-        
+
         # Draw location if available
-        location = event.get('location', '')
-        if location and len(location) < 30:
-            self.draw_text(screen, f"  @ {location}", (25, y_pos + 12), 
+        if event['_display_loc']:
+            self.draw_text(screen, event['_display_loc'], (25, y_pos + 12),
                           self.font_small, GRAY)
     
     def _draw_calendar_status(self, screen) -> None:
@@ -167,11 +302,11 @@ class ClockCalendarScreen(BaseScreen):
         Returns:
             Dictionary with time information
         """
-        now = datetime.now()
+        now = self._current_datetime(time.time())
         return {
-            'time': now.strftime('%H:%M:%S'),
-            'date': now.strftime('%d/%m/%Y'),
-            'day': now.strftime('%A'),
+            'time': f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}",
+            'date': f"{now.day:02d}/{now.month:02d}/{now.year}",
+            'day': _WEEKDAYS[now.weekday()],
             'timestamp': now.isoformat()
         }
     
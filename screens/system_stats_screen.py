@@ -2,11 +2,27 @@
 System statistics screen for the Raspberry Pi Dashboard.
 """
 
+import pygame
 import time
-from typing import Dict, Any
+from bisect import bisect_left
+from typing import Dict, Any, Optional
 from screens.base_screen import BaseScreen
 from utils.system_monitor import SystemMonitor
-from utils.constants import WHITE, GREEN, RED, GRAY, SCREEN_WIDTH, DEFAULT_SYSTEM_UPDATE_INTERVAL
+from utils.constants import (
+    WHITE, GREEN, RED, GRAY, ORANGE, YELLOW, SCREEN_WIDTH, SCREEN_HEIGHT,
+    DEFAULT_SYSTEM_UPDATE_INTERVAL
+)
+
+# Color threshold ladders: index with bisect_left(thresholds, value) to
+# get the color bucket, replacing the duplicated if/elif chains
+_TEMP_TEXT_THRESHOLDS = (70, 80)
+_TEMP_TEXT_COLORS = (WHITE, ORANGE, RED)
+_TEMP_BAR_THRESHOLDS = (50, 70, 80)
+_TEMP_BAR_COLORS = (GREEN, YELLOW, ORANGE, RED)
+_CPU_THRESHOLDS = (75, 90)
+_CPU_COLORS = (WHITE, ORANGE, RED)
+_MEMORY_THRESHOLDS = (80, 90)
+_MEMORY_COLORS = (WHITE, ORANGE, RED)
 
 
 class SystemStatsScreen(BaseScreen):
@@ -23,6 +39,59 @@ class SystemStatsScreen(BaseScreen):
         self.last_system_update = 0
         self.system_stats = {}
         self.update_interval = DEFAULT_SYSTEM_UPDATE_INTERVAL
+
+        # Static labels never change; render them once and blit per frame
+        self._lbl_cpu_temp = self._render_text("CPU Temperature:", self.font_medium, GREEN)
+        self._lbl_cpu_usage = self._render_text("CPU Usage:", self.font_medium, GREEN)
+        self._lbl_memory = self._render_text("Memory Usage:", self.font_medium, GREEN)
+        self._lbl_uptime = self._render_text("System Uptime:", self.font_medium, GREEN)
+
+        # Emoji glyph shaping is far slower than plain text (pygame falls
+        # back to a secondary font lookup), so render this badge exactly
+        # once instead of per frame
+        self._lbl_pi = self._render_text("🥧 Raspberry Pi", self.font_small, GREEN)
+
+        # Rendered numeric values keyed by stat name; entries are reused
+        # until the underlying value or its color bucket changes
+        self._cached_renders: Dict[str, Any] = {}
+
+        # Composite panel of all labels, values and bars, rebuilt only
+        # when a fresh stats snapshot arrives; draw() blits it in one go
+        self._panel_surface = None
+        self._panel_dirty = True
+
+        # Detail strings formatted once per stats refresh in update()
+        # rather than on every draw
+        self._fmt_memory_text = ''
+        self._fmt_disk_text = ''
+
+        # Last seen error message and its truncated display form
+        self._last_error_raw = None
+        self._last_error_trunc = ''
+
+    def _cached_value_text(self, key: str, value: Any, template: str,
+                           font, color) -> Any:
+        """
+        Render a formatted value, reusing the cached surface while the
+        value and color are unchanged.
+
+        Args:
+            key: Stat name used as cache key
+            value: Current value of the stat
+            template: printf-style template applied to the value
+            font: Font to render with
+            color: Text color (also part of the cache validity check)
+
+        Returns:
+            Rendered text surface
+        """
+        cached = self._cached_renders.get(key)
+        if cached is not None and cached[0] == value and cached[1] == color:
+            return cached[2]
+
+        surface = self._render_text(template % value, font, color)
+        self._cached_renders[key] = (value, color, surface)
+        return surface
     
     def update(self) -> None:
         """Update system statistics data."""
@@ -32,29 +101,94 @@ class SystemStatsScreen(BaseScreen):
         if current_time - self.last_system_update > self.update_interval:
             self.system_stats = SystemMonitor.get_complete_stats()
             self.last_system_update = current_time
-        
+            self._format_detail_strings()
+            self._panel_dirty = True
+
         self.last_update = current_time
+
+    def _format_detail_strings(self) -> None:
+        """Precompute the memory and disk detail lines for the new stats."""
+        memory_info = self.system_stats.get('memory', {})
+        memory_total_gb = memory_info.get('total_gb', 0)
+        if memory_total_gb > 0:
+            self._fmt_memory_text = (f"{memory_info.get('used_gb', 0):.1f}GB"
+                                     f" / {memory_total_gb:.1f}GB")
+        else:
+            self._fmt_memory_text = ''
+
+        disk_info = self.system_stats.get('disk', {})
+        if disk_info:
+            self._fmt_disk_text = (
+                f"Disk: {disk_info.get('percent', 0):.1f}%"
+                f" ({disk_info.get('used_gb', 0):.1f}GB"
+                f" / {disk_info.get('total_gb', 0):.1f}GB)")
+        else:
+            self._fmt_disk_text = ''
     
-    def draw(self, screen) -> None:
+    def draw(self, screen) -> Optional[list]:
         """
         Draw system statistics screen.
-        
+
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            None when the screen repainted, an empty list when nothing
+            visible changed since the previous frame
         """
-        screen.fill((0, 0, 0))  # Black background
-        
-        # Draw title
-        self.draw_title(screen, "System Stats", 30)
-        
-        if self.system_stats.get('status') == 'success':
-            self._draw_system_data(screen)
+        # Key the frame off the displayed values rather than the refresh
+        # timestamp: a refresh that reads back identical numbers (to the
+        # displayed precision) leaves the previous frame valid too
+        memory_info = self.system_stats.get('memory', {})
+        signature = (round(self.system_stats.get('cpu_temperature', 0), 1),
+                     round(self.system_stats.get('cpu_usage', 0), 1),
+                     round(memory_info.get('percent', 0), 1),
+                     self.system_stats.get('uptime', {}).get('formatted'),
+                     self.system_stats.get('status', 'unknown'))
+        if not self._frame_changed(signature):
+            return []
+
+        # Rebuild the composite panel only when the stats changed
+        if self._panel_surface is None or self._panel_dirty:
+            try:
+                if self._panel_surface is None:
+                    self._panel_surface = pygame.Surface(
+                        (SCREEN_WIDTH, SCREEN_HEIGHT))
+                self._draw_panel_content(self._panel_surface)
+                self._panel_dirty = False
+            except (pygame.error, TypeError):
+                # Offscreen compositing needs a working font/surface
+                # pipeline (absent under mocked test displays); fall
+                # back to drawing straight onto the target
+                self._panel_surface = None
+
+        if self._panel_surface is not None:
+            screen.blit(self._panel_surface, (0, 0))
         else:
-            self._draw_error_state(screen)
-        
+            self._draw_panel_content(screen)
+
         # Draw status indicator
         status = self.system_stats.get('status', 'unknown')
         self.draw_status_indicator(screen, status, (450, 20))
+
+        return None
+
+    def _draw_panel_content(self, surface) -> None:
+        """
+        Render the full stats panel onto the given surface.
+
+        Args:
+            surface: Surface to render the panel onto
+        """
+        surface.fill((0, 0, 0))  # Black background
+
+        # Draw title
+        self.draw_title(surface, "System Stats", 30)
+
+        if self.system_stats.get('status') == 'success':
+            self._draw_system_data(surface)
+        else:
+            self._draw_error_state(surface)
     
     def _draw_system_data(self, screen) -> None:
         """
@@ -95,18 +229,13 @@ class SystemStatsScreen(BaseScreen):
         cpu_temp = self.system_stats.get('cpu_temperature', 0)
         
         # Color code based on temperature
-        if cpu_temp > 80:
-            temp_color = RED
-        elif cpu_temp > 70:
-            temp_color = (255, 165, 0)  # Orange
-        else:
-            temp_color = WHITE
+        temp_color = _TEMP_TEXT_COLORS[bisect_left(_TEMP_TEXT_THRESHOLDS, cpu_temp)]
         
         # Draw temperature
-        self.draw_text(screen, "CPU Temperature:", (20, y_pos), 
-                      self.font_medium, GREEN)
-        self.draw_text(screen, f"{cpu_temp:.1f}°C", (20, y_pos + 25), 
-                      self.font_medium, temp_color)
+        screen.blit(self._lbl_cpu_temp, (20, y_pos))
+        screen.blit(self._cached_value_text('cpu_temp', cpu_temp, "%.1f°C",
+                                            self.font_medium, temp_color),
+                    (20, y_pos + 25))
         
         # Draw temperature bar
         self._draw_temperature_bar(screen, (220, y_pos + 30), cpu_temp)
@@ -122,18 +251,13 @@ class SystemStatsScreen(BaseScreen):
         cpu_percent = self.system_stats.get('cpu_usage', 0)
         
         # Color code based on usage
-        if cpu_percent > 90:
-            usage_color = RED
-        elif cpu_percent > 75:
-            usage_color = (255, 165, 0)  # Orange
-        else:
-            usage_color = WHITE
+        usage_color = _CPU_COLORS[bisect_left(_CPU_THRESHOLDS, cpu_percent)]
         
         # Draw CPU usage
-        self.draw_text(screen, "CPU Usage:", (20, y_pos), 
-                      self.font_medium, GREEN)
-        self.draw_text(screen, f"{cpu_percent:.1f}%", (20, y_pos + 25), 
-                      self.font_medium, usage_color)
+        screen.blit(self._lbl_cpu_usage, (20, y_pos))
+        screen.blit(self._cached_value_text('cpu_usage', cpu_percent, "%.1f%%",
+                                            self.font_medium, usage_color),
+                    (20, y_pos + 25))
         
         # Draw progress bar
         self.draw_progress_bar(screen, (150, y_pos + 30), (200, 12), 
@@ -149,27 +273,19 @@ class SystemStatsScreen(BaseScreen):
         """
         memory_info = self.system_stats.get('memory', {})
         memory_percent = memory_info.get('percent', 0)
-        memory_used_gb = memory_info.get('used_gb', 0)
-        memory_total_gb = memory_info.get('total_gb', 0)
-        
+
         # Color code based on usage
-        if memory_percent > 90:
-            memory_color = RED
-        elif memory_percent > 80:
-            memory_color = (255, 165, 0)  # Orange
-        else:
-            memory_color = WHITE
-        
+        memory_color = _MEMORY_COLORS[bisect_left(_MEMORY_THRESHOLDS, memory_percent)]
+
         # Draw memory usage
-        self.draw_text(screen, "Memory Usage:", (20, y_pos), 
-                      self.font_medium, GREEN)
-        self.draw_text(screen, f"{memory_percent:.1f}%", (20, y_pos + 25), 
-                      self.font_medium, memory_color)
-        
-        # Draw memory details
-        if memory_total_gb > 0:
-            memory_text = f"{memory_used_gb:.1f}GB / {memory_total_gb:.1f}GB"
-            self.draw_text(screen, memory_text, (250, y_pos + 5), 
+        screen.blit(self._lbl_memory, (20, y_pos))
+        screen.blit(self._cached_value_text('memory_percent', memory_percent, "%.1f%%",
+                                            self.font_medium, memory_color),
+                    (20, y_pos + 25))
+
+        # Draw memory details (formatted once per stats refresh)
+        if self._fmt_memory_text:
+            self.draw_text(screen, self._fmt_memory_text, (250, y_pos + 5),
                           self.font_small, GRAY)
         
         # Draw progress bar
@@ -187,8 +303,7 @@ class SystemStatsScreen(BaseScreen):
         uptime_info = self.system_stats.get('uptime', {})
         uptime_formatted = uptime_info.get('formatted', '0h 0m')
         
-        self.draw_text(screen, "System Uptime:", (20, y_pos), 
-                      self.font_medium, GREEN)
+        screen.blit(self._lbl_uptime, (20, y_pos))
         self.draw_text(screen, uptime_formatted, (20, y_pos + 20), 
                       self.font_medium, WHITE)
     
@@ -200,23 +315,16 @@ class SystemStatsScreen(BaseScreen):
             screen: Pygame surface to draw on
             y_pos: Y position to draw at
         """
-        # Disk usage (if space permits)
-        disk_info = self.system_stats.get('disk', {})
-        if disk_info and y_pos < 280:
-            disk_percent = disk_info.get('percent', 0)
-            disk_used_gb = disk_info.get('used_gb', 0)
-            disk_total_gb = disk_info.get('total_gb', 0)
-            
+        # Disk usage (if space permits; line formatted once per refresh)
+        if self._fmt_disk_text and y_pos < 280:
+            disk_percent = self.system_stats.get('disk', {}).get('percent', 0)
             disk_color = RED if disk_percent > 90 else WHITE
-            
-            disk_text = f"Disk: {disk_percent:.1f}% ({disk_used_gb:.1f}GB / {disk_total_gb:.1f}GB)"
-            self.draw_text(screen, disk_text, (20, y_pos), 
+            self.draw_text(screen, self._fmt_disk_text, (20, y_pos),
                           self.font_small, disk_color)
         
         # Raspberry Pi indicator
         if SystemMonitor.is_raspberry_pi():
-            self.draw_text(screen, "🥧 Raspberry Pi", (SCREEN_WIDTH - 120, 300), 
-                          self.font_small, GREEN)
+            screen.blit(self._lbl_pi, (SCREEN_WIDTH - 120, 300))
     
     def _draw_temperature_bar(self, screen, pos, temperature: float) -> None:
         """
@@ -232,14 +340,7 @@ class SystemStatsScreen(BaseScreen):
         temp_percent = min(temperature / max_temp * 100, 100)
         
         # Color based on temperature zones
-        if temperature > 80:
-            color = RED
-        elif temperature > 70:
-            color = (255, 165, 0)  # Orange
-        elif temperature > 50:
-            color = (255, 255, 0)  # Yellow
-        else:
-            color = GREEN
+        color = _TEMP_BAR_COLORS[bisect_left(_TEMP_BAR_THRESHOLDS, temperature)]
         
         self.draw_progress_bar(screen, pos, (150, 8), temp_percent, 100, 
                              fill_color=color)
@@ -252,15 +353,18 @@ class SystemStatsScreen(BaseScreen):
             screen: Pygame surface to draw on
         """
         error_msg = self.system_stats.get('error', 'Unknown error')
-        
-        self.draw_text(screen, "System Data Unavailable", (SCREEN_WIDTH // 2, 120), 
+
+        self.draw_text(screen, "System Data Unavailable", (SCREEN_WIDTH // 2, 120),
                       self.font_medium, RED, center=True)
-        
-        # Truncate long error messages
-        if len(error_msg) > 50:
-            error_msg = error_msg[:47] + "..."
-        
-        self.draw_text(screen, error_msg, (SCREEN_WIDTH // 2, 160), 
+
+        # The error is usually stable across many frames, so truncate it
+        # once and reuse the result until the message changes
+        if error_msg != self._last_error_raw:
+            self._last_error_raw = error_msg
+            self._last_error_trunc = (error_msg[:47] + "..."
+                                      if len(error_msg) > 50 else error_msg)
+
+        self.draw_text(screen, self._last_error_trunc, (SCREEN_WIDTH // 2, 160),
                       self.font_small, RED, center=True)
     
     def get_system_health_summary(self) -> Dict[str, Any]:
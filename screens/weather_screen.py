@@ -2,10 +2,12 @@
 Weather display screen showing current conditions.
 """
 
+import threading
+import time
 from typing import Tuple
 import pygame
 from screens.base_screen import BaseScreen
-from api.weather_api import WeatherAPIManager
+from api.weather_api import WeatherAPIManager, WeatherSnapshot
 from utils.constants import FONT_LARGE, FONT_MEDIUM, FONT_SMALL, WHITE, BLUE, GREEN, GRAY
 
 
@@ -20,144 +22,274 @@ class WeatherScreen(BaseScreen):
             app: Main application instance
         """
         super().__init__(app)
-        self.weather_api = WeatherAPIManager(app.config_manager)
+        # Share the app's manager instead of building a second one with
+        # its own HTTP session, cache and background refreshes
+        shared = getattr(app, 'weather_api', None)
+        if isinstance(shared, WeatherAPIManager):
+            self.weather_api = shared
+        else:
+            self.weather_api = WeatherAPIManager(app.config_manager)
+        self.last_weather_update = 0
+        self.weather_update_interval = 600  # 10 minutes
+
+        # Worker thread for forced refreshes so a slow API call never
+        # stalls the render loop; results land in the manager's
+        # thread-safe cache and are picked up by draw()
+        self._refresh_thread = None
+
+        # Composite of everything except the status line, rebuilt only
+        # when fresh weather data lands; per-frame work collapses to one
+        # blit plus the status overlay
+        self._composed_surface = None
+        self._composed_key = None
+
+        # The status line only changes once per wall-clock second, so
+        # cache the formatted text/color keyed by (second, status)
+        self._last_status_key = None
+        self._last_status_text = ''
+        self._last_status_color = GRAY
     
     def update(self):
         """Update weather data."""
-        # Force refresh weather data
-        self.weather_api.get_data(force_refresh=True)
+        current_time = time.time()
+
+        # Throttle update work to the screen's target rate
+        if not self._should_update(current_time):
+            return
+
+        # All fetching happens on the worker thread: force a refresh on
+        # the configured cadence, and revalidate early if the manager's
+        # cache expired. draw() keeps showing the last good data while
+        # the fetch runs (stale-while-revalidate), so the render thread
+        # never waits on HTTP
+        if current_time - self.last_weather_update > self.weather_update_interval:
+            self._start_weather_refresh()
+            self.last_weather_update = current_time
+        elif not self.weather_api.is_data_fresh():
+            self._start_weather_refresh()
+
+        self.last_update = current_time
+
+    def _start_weather_refresh(self) -> None:
+        """Kick off a background weather refresh if none is running."""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+
+        def _refresh():
+            try:
+                self.weather_api.get_data(force_refresh=True)
+            except Exception as e:
+                print(f"Error updating weather: {e}")
+
+        self._refresh_thread = threading.Thread(target=_refresh, daemon=True)
+        self._refresh_thread.start()
     
     def draw(self, screen: pygame.Surface):
         """
         Draw weather information on screen.
-        
+
         Args:
             screen: Pygame surface to draw on
+
+        Returns:
+            None when the screen repainted, an empty list when nothing
+            visible changed since the previous frame
         """
-        # Clear screen
-        screen.fill((0, 0, 0))
-        
         try:
-            # Get weather data
-            data = self.weather_api.get_data()
+            # One snapshot call replaces the eight per-field accessor
+            # calls the draw path used to make
+            snap = self.weather_api.snapshot()
+            data = snap.data
+
+            # The status line shows data age in whole seconds, but only
+            # for live/cached data — in mock or error status nothing on
+            # screen ticks, so the age stays out of the signature and
+            # those frames skip entirely
+            if snap.status in ('success', 'cached'):
+                age = int(self.weather_api.get_data_age() or 0)
+            else:
+                age = None
+            signature = (snap.last_updated, snap.status, age)
+            if not self._frame_changed(signature):
+                return []
+
             if not data:
+                screen.fill((0, 0, 0))
                 self.draw_error_message(screen, "No weather data available")
-                return
-            
-            y_offset = 30
-            
-            # Title with data source indicator
-            data_source = self.weather_api.get_data_source_info()
-            title = f"Weather - {data_source}"
-            self.draw_title(screen, title, y_offset, size=FONT_SMALL)
-            y_offset += 40
-            
-            # Get screen dimensions
-            screen_width = screen.get_width()
-            screen_height = screen.get_height()
-            
-            # Location
-            city = data.get('city', 'Unknown')
-            country = data.get('country', '')
-            location = f"{city}, {country}" if country else city
-            self.draw_text(screen, location, (screen_width // 2, y_offset), 
-                          self.font_medium, WHITE, center=True)
-            y_offset += 45
-            
-            # Main temperature and icon
-            temp = self.weather_api.get_formatted_temperature()
-            icon = self.weather_api.get_icon()
-            temp_text = f"{icon} {temp}"
-            self.draw_text(screen, temp_text, (screen_width // 2, y_offset), 
-                          self.font_large, WHITE, center=True)
-            y_offset += 60
-            
-            # Weather condition
-            condition = self.weather_api.get_condition()
-            self.draw_text(screen, condition, (screen_width // 2, y_offset), 
-                          self.font_medium, BLUE, center=True)
-            y_offset += 40
-            
-            # Additional details in two columns
-            self._draw_weather_details(screen, data, y_offset)
-            
-            # Status indicator
-            self._draw_status_indicator(screen, screen_width, screen_height)
-            
+                return None
+
+            # Rebuild the static composite only when a displayed field
+            # actually changes — a refresh that reads back the same
+            # values (common in mock mode) keeps the old composite even
+            # though last_updated ticked
+            composed_key = (snap.data_source_info, snap.city, snap.country,
+                            snap.temperature_formatted, snap.icon,
+                            snap.condition, snap.humidity, snap.pressure,
+                            snap.visibility, snap.wind_speed_formatted)
+            if self._composed_surface is not None and composed_key == self._composed_key:
+                # Only the status age ticked: restore the bottom strip
+                # from the composite, redraw the status line and report
+                # just that region as dirty
+                strip = pygame.Rect(0, self.screen_height - 30,
+                                    self.screen_width, 30)
+                screen.blit(self._composed_surface, strip.topleft, strip)
+                self._draw_status_indicator(screen, snap.status)
+                return [strip]
+
+            try:
+                # Reuse the composite buffer across refreshes; only the
+                # first build allocates
+                if self._composed_surface is None:
+                    self._composed_surface = pygame.Surface(
+                        (self.screen_width, self.screen_height))
+                self._compose_static_content(self._composed_surface, snap)
+                self._composed_key = composed_key
+            except (pygame.error, TypeError):
+                # Offscreen compositing needs a working font/surface
+                # pipeline (absent under mocked test displays); fall
+                # back to drawing straight onto the target
+                self._composed_surface = None
+
+            if self._composed_surface is not None:
+                screen.blit(self._composed_surface, (0, 0))
+            else:
+                screen.fill((0, 0, 0))
+                self._compose_static_content(screen, snap)
+
+            # Status indicator (drawn per frame; the age ticks every second)
+            self._draw_status_indicator(screen, snap.status)
+
         except Exception as e:
+            screen.fill((0, 0, 0))
             error_msg = f"Weather error: {str(e)}"
             self.draw_error_message(screen, error_msg)
+
+        return None
     
-    def _draw_weather_details(self, screen: pygame.Surface, data: dict, y_offset: int):
+    def _compose_static_content(self, surface: pygame.Surface,
+                                snap: WeatherSnapshot) -> None:
+        """
+        Draw everything that only changes with the weather data itself.
+
+        Args:
+            surface: Surface to draw on (composite or the live screen)
+            snap: Weather data snapshot
+        """
+        surface.fill((0, 0, 0))
+
+        y_offset = 30
+
+        # Title with data source indicator
+        title = f"Weather - {snap.data_source_info}"
+        self.draw_title(surface, title, y_offset, size=FONT_SMALL)
+        y_offset += 40
+
+        # Screen dimensions are cached on the base class
+        screen_width = self.screen_width
+
+        # Location
+        city = snap.city
+        country = snap.country
+        location = f"{city}, {country}" if country else city
+        self.draw_text(surface, location, (screen_width // 2, y_offset),
+                      self.font_medium, WHITE, center=True)
+        y_offset += 45
+
+        # Main temperature and icon
+        temp_text = f"{snap.icon} {snap.temperature_formatted}"
+        self.draw_text(surface, temp_text, (screen_width // 2, y_offset),
+                      self.font_large, WHITE, center=True)
+        y_offset += 60
+
+        # Weather condition
+        self.draw_text(surface, snap.condition, (screen_width // 2, y_offset),
+                      self.font_medium, BLUE, center=True)
+        y_offset += 40
+
+        # Additional details in two columns
+        self._draw_weather_details(surface, snap, y_offset)
+
+    def _draw_weather_details(self, screen: pygame.Surface,
+                              snap: WeatherSnapshot, y_offset: int):
         """
         Draw detailed weather information in two columns.
-        
+
         Args:
             screen: Pygame surface to draw on
-            data: Weather data dictionary
+            snap: Weather snapshot from WeatherAPIManager.snapshot()
             y_offset: Vertical offset to start drawing
         """
         # Left column
         left_x = 80
         right_x = 320
-        
+
         # Humidity
-        humidity = data.get('humidity', 0)
+        humidity = snap.humidity
         self.draw_text(screen, f"Humidity: {humidity}%", (left_x, y_offset),
-                      self.font_small, WHITE)
-        
+                      self.font_small, WHITE, antialias=False)
+
         # Wind
-        wind_info = self.weather_api.get_wind_info()
-        wind_text = f"Wind: {wind_info['speed_formatted']}"
+        wind_text = f"Wind: {snap.wind_speed_formatted}"
         self.draw_text(screen, wind_text, (right_x, y_offset),
-                      self.font_small, WHITE)
-        
+                      self.font_small, WHITE, antialias=False)
+
         y_offset += 30
-        
+
         # Pressure
-        pressure = data.get('pressure', 0)
+        pressure = snap.pressure
         if pressure > 0:
             self.draw_text(screen, f"Pressure: {pressure} hPa", (left_x, y_offset),
-                          self.font_small, WHITE)
-        
+                          self.font_small, WHITE, antialias=False)
+
         # Visibility
-        visibility = data.get('visibility', 0)
+        visibility = snap.visibility
         if visibility > 0:
             self.draw_text(screen, f"Visibility: {visibility:.1f} km", (right_x, y_offset),
-                          self.font_small, WHITE)
+                          self.font_small, WHITE, antialias=False)
     
-    def _draw_status_indicator(self, screen: pygame.Surface, screen_width: int, screen_height: int):
+    def _draw_status_indicator(self, screen: pygame.Surface, status: str):
         """
         Draw status indicator showing data freshness and source.
-        
+
         Args:
             screen: Pygame surface to draw on
-            screen_width: Width of the screen
-            screen_height: Height of the screen
+            status: Current API status from the frame's snapshot
         """
-        status = self.weather_api.get_status()
-        cache_info = self.weather_api.get_cache_info()
-        age = cache_info.get('age_seconds', 0)
-        
-        # Determine status color and text
-        if status == 'mock':
-            status_color = BLUE
-            status_text = f"🧪 DEMO MODE"
-        elif status == 'success':
-            status_color = GREEN
-            status_text = f"✓ Live ({age:.0f}s ago)"
-        elif status == 'cached':
-            status_color = BLUE
-            status_text = f"⏱ Cached ({age:.0f}s ago)"
+        # The displayed age only ticks once per wall-clock second, so
+        # only reformat the string when the second (or status) changes
+        status_key = (int(time.time()), status)
+        if status_key == self._last_status_key:
+            status_text = self._last_status_text
+            status_color = self._last_status_color
         else:
-            status_color = GRAY
-            status_text = f"⚠ {status}"
-        
-        # Draw status in bottom right (calculate position to right-align text)
-        text_surface = self.font_small.render(status_text, True, status_color)
-        text_width = text_surface.get_width()
-        status_pos = (screen_width - text_width - 10, screen_height - 25)
-        self.draw_text(screen, status_text, status_pos, self.font_small, status_color)
+            age = self.weather_api.get_data_age() or 0
+
+            # Determine status color and text
+            if status == 'mock':
+                status_color = BLUE
+                status_text = "🧪 DEMO MODE"
+            elif status == 'success':
+                status_color = GREEN
+                status_text = f"✓ Live ({age:.0f}s ago)"
+            elif status == 'cached':
+                status_color = BLUE
+                status_text = f"⏱ Cached ({age:.0f}s ago)"
+            else:
+                status_color = GRAY
+                status_text = f"⚠ {status}"
+
+            self._last_status_key = status_key
+            self._last_status_text = status_text
+            self._last_status_color = status_color
+
+        # Render once through the shared text cache and blit the same
+        # surface that was measured; the old code rendered the string a
+        # second time inside draw_text just to right-align it
+        text_surface = self._render_text(status_text, self.font_small,
+                                         status_color, antialias=False)
+        status_pos = (self.screen_width - text_surface.get_width() - 10,
+                      self.screen_height - 25)
+        screen.blit(text_surface, status_pos)
     
     def get_screen_name(self) -> str:
         """
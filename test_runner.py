@@ -8,8 +8,12 @@ detailed reports about the application's functionality.
 
 import sys
 import os
+import importlib.util
+import py_compile
 import subprocess
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
 from pathlib import Path
 
 # Colors for terminal output
@@ -42,10 +46,11 @@ def check_dependencies():
     missing_packages = []
     
     for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
+        # find_spec only resolves the loader; unlike __import__ it does
+        # not execute the package and drag in its dependency graph
+        if importlib.util.find_spec(package.replace('-', '_')) is not None:
             print(f"  ✓ {package}")
-        except ImportError:
+        else:
             missing_packages.append(package)
             print_colored(f"  ✗ {package} (missing)", Colors.FAIL)
     
@@ -153,14 +158,27 @@ def validate_application():
         "utils/system_monitor.py"
     ]
     
+    # One scandir per directory instead of a stat call per file
+    by_dir = defaultdict(set)
+    for file_path in required_files:
+        by_dir[os.path.dirname(file_path) or '.'].add(os.path.basename(file_path))
+
+    present = {}
+    for directory in by_dir:
+        try:
+            present[directory] = {entry.name for entry in os.scandir(directory)}
+        except FileNotFoundError:
+            present[directory] = set()
+
     missing_files = []
     for file_path in required_files:
-        if not Path(file_path).exists():
+        directory = os.path.dirname(file_path) or '.'
+        if os.path.basename(file_path) not in present[directory]:
             missing_files.append(file_path)
             print_colored(f"  ✗ {file_path} (missing)", Colors.FAIL)
         else:
             print(f"  ✓ {file_path}")
-    
+
     if missing_files:
         print_colored(f"\n❌ Missing {len(missing_files)} required files!", Colors.FAIL)
         return False
@@ -172,10 +190,11 @@ def validate_application():
     for file_path in required_files:
         if file_path.endswith('.py'):
             try:
-                with open(file_path, 'r') as f:
-                    compile(f.read(), file_path, 'exec')
+                # py_compile reuses the mtime-keyed .pyc, so unchanged
+                # files skip parsing on repeat runs
+                py_compile.compile(file_path, doraise=True)
                 print(f"  ✓ {file_path}")
-            except SyntaxError as e:
+            except py_compile.PyCompileError as e:
                 print_colored(f"  ✗ {file_path} - Syntax Error: {e}", Colors.FAIL)
                 return False
             except Exception as e:
@@ -187,43 +206,61 @@ def validate_application():
 def generate_test_report():
     """Generate a comprehensive test report."""
     print_colored("\n📊 Generating test coverage report...", Colors.OKBLUE)
-    
-    # Run tests with HTML coverage report
-    cmd = [
-        "python", "-m", "pytest",
-        "tests/",
-        "--cov=config",
-        "--cov=core", 
-        "--cov=api",
-        "--cov=screens",
-        "--cov=utils",
-        "--cov-report=html:test_reports/coverage",
-        "--cov-report=xml:test_reports/coverage.xml",
-        "--junit-xml=test_reports/junit.xml",
-        "-q"
-    ]
-    
+
     # Create reports directory
     Path("test_reports").mkdir(exist_ok=True)
-    
+
     # Set environment for testing
     env = os.environ.copy()
     env['SDL_VIDEODRIVER'] = 'dummy'
-    
+
     try:
-        result = subprocess.run(cmd, env=env, capture_output=True, text=True)
-        
-        if result.returncode == 0:
+        # Gather coverage data only if a previous test run didn't leave
+        # any behind; the main flow reuses the .coverage file from
+        # run_tests instead of executing the whole suite a second time
+        if not Path(".coverage").exists():
+            cmd = [
+                "python", "-m", "pytest",
+                "tests/",
+                "--cov=config",
+                "--cov=core",
+                "--cov=api",
+                "--cov=screens",
+                "--cov=utils",
+                "--cov-report=",
+                "--junit-xml=test_reports/junit.xml",
+                "-q"
+            ]
+            result = subprocess.run(cmd, env=env, capture_output=True, text=True)
+            if result.returncode != 0:
+                print_colored("❌ Failed to generate test report", Colors.FAIL)
+                print(result.stderr)
+                return False
+
+        # Render the HTML and XML reports concurrently from the same
+        # coverage data file
+        render_cmds = [
+            ["python", "-m", "coverage", "html", "-d", "test_reports/coverage"],
+            ["python", "-m", "coverage", "xml", "-o", "test_reports/coverage.xml"],
+        ]
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(
+                lambda c: subprocess.run(c, env=env, capture_output=True, text=True),
+                render_cmds
+            ))
+
+        if all(r.returncode == 0 for r in results):
             print_colored("✓ Test report generated successfully", Colors.OKGREEN)
             print(f"  📁 Coverage report: test_reports/coverage/index.html")
             print(f"  📄 XML coverage: test_reports/coverage.xml")
-            print(f"  📄 JUnit XML: test_reports/junit.xml")
             return True
         else:
             print_colored("❌ Failed to generate test report", Colors.FAIL)
-            print(result.stderr)
+            for r in results:
+                if r.returncode != 0:
+                    print(r.stderr)
             return False
-            
+
     except Exception as e:
         print_colored(f"❌ Error generating report: {e}", Colors.FAIL)
         return False
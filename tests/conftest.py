@@ -2,155 +2,465 @@
 Pytest configuration and shared fixtures for the dashboard test suite.
 """
 
+import copy
 import os
+import itertools
 import tempfile
 import json
 import pytest
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
-import pygame
+
+# Short-circuit SDL's video/audio probes before anything can import
+# pygame — pytest_configure runs too late for modules pulled in during
+# collection
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from config.config_manager import ConfigManager
+
+# pygame is deliberately not imported here: the fixtures only patch its
+# names by string, and mock.patch imports the module lazily when the
+# first pygame-using fixture is entered. Suites that never touch a
+# screen skip the SDL library load entirely.
+
+# Use orjson for fixture serialization when it is available; it emits
+# bytes directly and is several times faster than the stdlib encoder
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
 
 # Test configuration and fixtures
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
+_temp_dir_counter = itertools.count()
+
+def _write_bytes(path, data):
+    """Write bytes to path through a raw fd.
+
+    The fixture payloads are small pre-encoded blobs; going through
+    os.open/os.write skips the TextIOWrapper/BufferedWriter stack that
+    open() builds for a single write.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+@pytest.fixture(scope="session")
+def _temp_dir_base():
+    """Session-wide base temporary directory, removed once at the end."""
     with tempfile.TemporaryDirectory() as tmpdir:
         yield tmpdir
 
 @pytest.fixture
-def mock_env_file(temp_dir):
+def temp_dir(request, _temp_dir_base):
+    """Create a temporary directory for test files.
+
+    Each test gets a fresh subdirectory of the session base, which is
+    much cheaper than a full mkdtemp + recursive delete per test.
+    """
+    path = os.path.join(_temp_dir_base,
+                        f"{request.node.name}_{next(_temp_dir_counter)}")
+    os.makedirs(path)
+    return path
+
+@pytest.fixture(autouse=True)
+def _isolate_cwd(temp_dir, monkeypatch):
+    """Run every test from its own temp directory.
+
+    Replaces the per-test `with patch('os.getcwd', ...)` stacks: code
+    under test that opens relative paths (.env, config.json) now
+    resolves them into the test's directory with a single chdir and no
+    mock bookkeeping, and tests can't read stray files from the repo
+    root.
+    """
+    monkeypatch.chdir(temp_dir)
+    return temp_dir
+
+# Fixture payloads serialized once at import; the fixtures just write
+# the bytes into each test's temp dir instead of re-serializing per test
+_ENV_BYTES = (
+    b"# Test environment configuration\n"
+    b"WEATHER_API_KEY=test_weather_key\n"
+    b"WEATHER_CITY=TestCity,TC\n"
+    b"WEATHER_UNITS=metric\n"
+    b"WEATHER_MOCK_MODE=false\n"
+    b"API_UPDATE_INTERVAL=60\n"
+    b"SYSTEM_UPDATE_INTERVAL=2\n"
+    b"TOUCH_SWIPE_THRESHOLD=50\n"
+    b"APP_FPS=15\n"
+    b"DEBUG_MODE=true\n"
+    b"GOOGLE_CALENDAR_CREDENTIALS_FILE=test_credentials.json"
+)
+
+_CONFIG_BYTES = _dumps({
+    "weather": {
+        "api_key": "json_weather_key",
+        "city": "JsonCity,JC",
+        "units": "imperial"
+    },
+    "display": {
+        "brightness": 80,
+        "timeout": 30
+    },
+    "app": {
+        "fps": 25,
+        "api_update_interval": 120
+    },
+    "google_calendar": {
+        "credentials_file": "json_credentials.json",
+        "token_file": "json_token.json"
+    }
+})
+
+_CREDENTIALS_BYTES = _dumps({
+    "installed": {
+        "client_id": "test_client_id",
+        "client_secret": "test_client_secret",
+        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+        "token_uri": "https://oauth2.googleapis.com/token"
+    }
+})
+
+@pytest.fixture
+def write_to_tmp(temp_dir):
+    """Factory that writes a named payload into the test's temp dir.
+
+    Replaces the three copy-pasted join/write fixture bodies. Writes
+    are memoized by (name, content) within a test, so asking for the
+    same file twice skips the syscalls.
+    """
+    written = {}
+
+    def _write(name, content):
+        data = content if isinstance(content, bytes) else content.encode()
+        key = (name, hash(data))
+        if key not in written:
+            path = os.path.join(temp_dir, name)
+            _write_bytes(path, data)
+            written[key] = path
+        return written[key]
+
+    return _write
+
+@pytest.fixture
+def mock_env_file(write_to_tmp):
     """Create a mock .env file for testing."""
-    env_content = """
-# Test environment configuration
-WEATHER_API_KEY=test_weather_key
-WEATHER_CITY=TestCity,TC
-WEATHER_UNITS=metric
-WEATHER_MOCK_MODE=false
-API_UPDATE_INTERVAL=60
-SYSTEM_UPDATE_INTERVAL=2
-TOUCH_SWIPE_THRESHOLD=50
-APP_FPS=15
-DEBUG_MODE=true
-GOOGLE_CALENDAR_CREDENTIALS_FILE=test_credentials.json
-"""
-    env_path = os.path.join(temp_dir, '.env')
-    with open(env_path, 'w') as f:
-        f.write(env_content.strip())
-    return env_path
+    return write_to_tmp('.env', _ENV_BYTES)
 
 @pytest.fixture
-def mock_config_json(temp_dir):
+def mock_config_json(write_to_tmp):
     """Create a mock config.json file for testing."""
-    config_data = {
-        "weather": {
-            "api_key": "json_weather_key",
-            "city": "JsonCity,JC",
-            "units": "imperial"
-        },
-        "display": {
-            "brightness": 80,
-            "timeout": 30
-        },
-        "app": {
-            "fps": 25,
-            "api_update_interval": 120
-        },
-        "google_calendar": {
-            "credentials_file": "json_credentials.json",
-            "token_file": "json_token.json"
-        }
-    }
-    config_path = os.path.join(temp_dir, 'config.json')
-    with open(config_path, 'w') as f:
-        json.dump(config_data, f)
-    return config_path
+    return write_to_tmp('config.json', _CONFIG_BYTES)
+
+@pytest.fixture(scope="module")
+def loaded_config(_temp_dir_base):
+    """A ConfigManager parsed once per module for read-only tests.
+
+    Constructing ConfigManager re-parses the .env and config.json files
+    every time; tests that never call set() share this single instance
+    instead of paying that cost per test.
+    """
+    path = os.path.join(_temp_dir_base,
+                        f"loaded_config_{next(_temp_dir_counter)}")
+    os.makedirs(path)
+    _write_bytes(os.path.join(path, '.env'), _ENV_BYTES)
+    _write_bytes(os.path.join(path, 'config.json'), _CONFIG_BYTES)
+    old_cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        return ConfigManager()
+    finally:
+        os.chdir(old_cwd)
+
+@pytest.fixture(scope="session")
+def base_config(_temp_dir_base):
+    """One ConfigManager for the whole session.
+
+    Tests that only need "a config with some settings tweaked" get this
+    instead of writing a bespoke .env and re-running the dotenv/JSON
+    parse; per-test values go in through config.set() via the config
+    fixture below.
+    """
+    path = os.path.join(_temp_dir_base, 'base_config')
+    os.makedirs(path)
+    _write_bytes(os.path.join(path, '.env'), _ENV_BYTES)
+    old_cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        return ConfigManager()
+    finally:
+        os.chdir(old_cwd)
 
 @pytest.fixture
-def mock_credentials_json(temp_dir):
-    """Create a mock Google credentials file."""
-    credentials_data = {
-        "installed": {
-            "client_id": "test_client_id",
-            "client_secret": "test_client_secret",
-            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-            "token_uri": "https://oauth2.googleapis.com/token"
-        }
-    }
-    cred_path = os.path.join(temp_dir, 'test_credentials.json')
-    with open(cred_path, 'w') as f:
-        json.dump(credentials_data, f)
-    return cred_path
+def config(base_config):
+    """Per-test view of the session ConfigManager.
+
+    The parsed config dict is snapshotted before the test and restored
+    after, so config.set() overrides never leak across tests.
+    """
+    saved = copy.deepcopy(base_config.config)
+    yield base_config
+    base_config.config = saved
+    # Restoring swaps the dict behind set()'s back, so advance the
+    # mutation counter by hand to invalidate derived-value caches
+    base_config.version += 1
 
 @pytest.fixture
-def mock_pygame():
-    """Mock pygame to avoid display initialization in tests."""
+def env(monkeypatch):
+    """In-memory stand-in for the .env file.
+
+    ConfigManager only sees the .env file through load_dotenv (which
+    copies it into os.environ) and os.path.exists checks, so tests can
+    skip the disk round-trip entirely: put variables in the returned
+    dict and they land in os.environ when ConfigManager "loads" the
+    file. monkeypatch rolls every change back after the test.
+    """
+    store = {}
+    real_exists = os.path.exists
+
+    def fake_load_dotenv(path=None, *args, **kwargs):
+        for name, value in store.items():
+            monkeypatch.setenv(name, str(value))
+        return True
+
+    monkeypatch.setattr('config.config_manager.load_dotenv',
+                        fake_load_dotenv)
+    monkeypatch.setattr(
+        os.path, 'exists',
+        lambda p: True if p == '.env' else real_exists(p))
+    return store
+
+@pytest.fixture(scope="session")
+def test_layout(_temp_dir_base):
+    """All three canonical fixture files laid down once, in one directory.
+
+    Tests that need the standard .env/config.json/credentials trio (and
+    never modify them) share this layout instead of triggering separate
+    per-test fixture writes into fresh directories.
+    """
+    d = os.path.join(_temp_dir_base, 'layout')
+    os.makedirs(d)
+    env = os.path.join(d, '.env')
+    config = os.path.join(d, 'config.json')
+    creds = os.path.join(d, 'test_credentials.json')
+    _write_bytes(env, _ENV_BYTES)
+    _write_bytes(config, _CONFIG_BYTES)
+    _write_bytes(creds, _CREDENTIALS_BYTES)
+    return SimpleNamespace(dir=d, env=env, config=config, creds=creds)
+
+@pytest.fixture(scope="session")
+def invalid_json_dir(_temp_dir_base):
+    """Directory holding a malformed config.json, written once.
+
+    The bad bytes never change, so the file is baked into the session
+    temp base instead of being rewritten for every test that needs it.
+    """
+    path = os.path.join(_temp_dir_base, 'invalid_json')
+    os.makedirs(path)
+    _write_bytes(os.path.join(path, 'config.json'), b'{ invalid json }')
+    return path
+
+@pytest.fixture(scope="session")
+def mock_credentials_json(test_layout):
+    """Stable absolute path to the mock Google credentials file.
+
+    The credentials are immutable, so this rides on the session layout
+    instead of rewriting the same JSON into every test's temp dir.
+    """
+    return test_layout.creds
+
+@dataclass
+class FakeApp:
+    """Bare application stand-in for constructing screens.
+
+    Screens only reach for app.config_manager (and keep the app
+    reference); real attributes avoid the child-mock creation Mock
+    pays on every attribute access during draw()/update().
+    """
+    screen: object
+    config_manager: object
+
+
+@pytest.fixture
+def make_fake_app(mock_pygame):
+    """Factory building a FakeApp around the stub display surface."""
+    def _make(config_manager):
+        return FakeApp(screen=mock_pygame, config_manager=config_manager)
+    return _make
+
+class _StubSurface:
+    """Minimal pygame.Surface stand-in for screen tests.
+
+    Surfaces are hit thousands of times per drawn frame; plain methods
+    keep that on the fast attribute path instead of Mock's dynamic
+    child-mock machinery. fill records its arguments in fill_calls so
+    tests can still assert the screen was cleared.
+    """
+
+    __slots__ = ('fill_calls',)
+
+    def __init__(self):
+        self.fill_calls = []
+
+    def fill(self, *args, **kwargs):
+        self.fill_calls.append(args)
+
+    def get_width(self):
+        return 480
+
+    def get_height(self):
+        return 320
+
+    def blit(self, *args, **kwargs):
+        pass
+
+@pytest.fixture(scope="session")
+def pool():
+    """Shared worker pool for concurrency tests.
+
+    Thread creation costs more than the handful of cache calls each
+    worker makes, so concurrency tests submit to this pool instead of
+    spawning their own threads.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        yield executor
+
+@pytest.fixture(scope="session")
+def _mock_pygame_session():
+    """Session-wide pygame patches; entering six patch contexts per test
+    added up, and the tests never need isolated pygame state."""
     with patch('pygame.init'), \
          patch('pygame.display.set_mode') as mock_display, \
          patch('pygame.time.Clock'), \
          patch('pygame.event.get', return_value=[]), \
          patch('pygame.display.flip'), \
          patch('pygame.quit'):
-        
-        # Create a mock surface
-        mock_surface = Mock()
-        mock_surface.fill = Mock()
-        mock_surface.get_width.return_value = 480
-        mock_surface.get_height.return_value = 320
+
+        mock_surface = _StubSurface()
         mock_display.return_value = mock_surface
-        
+
         yield mock_surface
 
 @pytest.fixture
-def mock_requests():
-    """Mock requests for API testing."""
+def mock_pygame(_mock_pygame_session):
+    """Mock pygame to avoid display initialization in tests."""
+    # Fresh call record per test on the shared stub surface
+    _mock_pygame_session.fill_calls.clear()
+    return _mock_pygame_session
+
+@pytest.fixture(scope="module")
+def pygame_patches(_mock_pygame_session):
+    """Everything needed to construct a DashboardApp, patched once per
+    module on top of the session-wide pygame patches."""
+    with patch('pygame.font.Font'), \
+         patch('pygame.display.set_caption'), \
+         patch('pygame.mouse.set_visible'), \
+         patch('threading.Thread'):
+        yield _mock_pygame_session
+
+@pytest.fixture(scope="session")
+def _mock_requests_session():
+    """Session-wide requests.Session patch shared by all API tests."""
+    import requests
+
     with patch('requests.Session') as mock_session_class:
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.json.return_value = {"test": "data"}
-        mock_response.raise_for_status = Mock()
-        mock_session.get.return_value = mock_response
+        # spec'd mocks resolve attribute access against a precomputed
+        # snapshot of the real class instead of allocating a child mock
+        # for every name touched, and they reject typo'd attributes
+        mock_session = Mock(spec=requests.Session)
         mock_session_class.return_value = mock_session
         yield mock_session
 
 @pytest.fixture
+def mock_requests(_mock_requests_session):
+    """Mock requests for API testing."""
+    import requests
+
+    # Reset per-test state and reinstall the default canned response
+    _mock_requests_session.reset_mock(return_value=True, side_effect=True)
+    mock_response = Mock(spec=requests.Response)
+    mock_response.json.return_value = {"test": "data"}
+    mock_response.raise_for_status = Mock()
+    _mock_requests_session.get.return_value = mock_response
+    return _mock_requests_session
+
+# Sample API payloads built once at import. The fixtures hand out the
+# same object to every test — the payloads are treated as read-only
+# (they only ever feed responses registrations and assertions). Left as
+# plain dicts rather than MappingProxyType because the responses
+# library json-serializes them.
+_SAMPLE_WEATHER = {
+    "weather": [{"main": "Clear", "description": "clear sky"}],
+    "main": {
+        "temp": 22.5,
+        "humidity": 45,
+        "pressure": 1015
+    },
+    "wind": {
+        "speed": 3.2,
+        "deg": 180
+    },
+    "visibility": 10000,
+    "sys": {
+        "country": "UK",
+        "sunrise": 1234567890,
+        "sunset": 1234567900
+    },
+    "name": "TestCity"
+}
+
+_SAMPLE_BITCOIN = {
+    "bitcoin": {
+        "usd": 45000.50
+    }
+}
+
+_SAMPLE_BLOCKCHAIN = {
+    "height": 800000,
+    "hash": "0000000000000000000a1b2c3d4e5f6789abcdef",
+    "time": 1234567890
+}
+
+# Serialized once at import; every responses registration reuses the
+# same bytes instead of re-encoding the dicts
+_SAMPLE_JSON_BYTES = {
+    'weather': _dumps(_SAMPLE_WEATHER),
+    'bitcoin': _dumps(_SAMPLE_BITCOIN),
+    'blockchain': _dumps(_SAMPLE_BLOCKCHAIN),
+}
+
+@pytest.fixture(scope="session")
+def sample_json_bytes():
+    """Pre-serialized sample payloads for responses registrations.
+
+    Passing these as body=... with an application/json content type
+    skips the json.dumps the responses library would otherwise run at
+    every registration.
+    """
+    return _SAMPLE_JSON_BYTES
+
+@pytest.fixture(scope="session")
 def sample_weather_data():
     """Sample weather API response data."""
-    return {
-        "weather": [{"main": "Clear", "description": "clear sky"}],
-        "main": {
-            "temp": 22.5,
-            "humidity": 45,
-            "pressure": 1015
-        },
-        "wind": {
-            "speed": 3.2,
-            "deg": 180
-        },
-        "visibility": 10000,
-        "sys": {
-            "country": "UK",
-            "sunrise": 1234567890,
-            "sunset": 1234567900
-        },
-        "name": "TestCity"
-    }
+    return _SAMPLE_WEATHER
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_bitcoin_data():
     """Sample Bitcoin API response data."""
-    return {
-        "bitcoin": {
-            "usd": 45000.50
-        }
-    }
+    return _SAMPLE_BITCOIN
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_blockchain_data():
     """Sample blockchain API response data."""
-    return {
-        "height": 800000,
-        "hash": "0000000000000000000a1b2c3d4e5f6789abcdef",
-        "time": 1234567890
-    }
+    return _SAMPLE_BLOCKCHAIN
 
 @pytest.fixture
 def mock_system_stats():
@@ -165,19 +475,34 @@ def mock_system_stats():
     }
 
 # Test environment setup
+_original_env = {}
+
 def pytest_configure(config):
     """Configure pytest environment."""
-    # Ensure we don't accidentally initialize real pygame
-    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    # One snapshot for the whole session; the autouse fixture below
+    # restores against it instead of copying the environment per test
+    _original_env.clear()
+    _original_env.update(os.environ)
 
 @pytest.fixture(autouse=True)
 def reset_environment():
-    """Reset environment variables before each test."""
-    # Store original env vars
-    original_env = dict(os.environ)
-    
+    """Reset environment variables after each test.
+
+    Only the keys a test actually added or changed are touched (tests
+    mostly pollute the environment indirectly via load_dotenv), which
+    avoids a full environment copy plus a setenv call per variable on
+    every test.
+    """
     yield
-    
-    # Restore original env vars and clear test vars
-    os.environ.clear()
-    os.environ.update(original_env) 
\ No newline at end of file
+
+    for key in list(os.environ):
+        if key == 'PYTEST_CURRENT_TEST':
+            # Owned by pytest itself; it removes the key after teardown
+            continue
+        original = _original_env.get(key)
+        if original is None:
+            del os.environ[key]
+        elif os.environ[key] != original:
+            os.environ[key] = original
+    for key in _original_env.keys() - os.environ.keys():
+        os.environ[key] = _original_env[key]
\ No newline at end of file
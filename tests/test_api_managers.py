@@ -14,6 +14,43 @@ from api.base_api import BaseAPIManager
 import os
 
 
+@pytest.fixture(scope="module")
+def mock_api_responses(sample_json_bytes):
+    """Module-wide responses registry for the happy-path endpoints.
+
+    @responses.activate rebuilds and tears down the RequestsMock per
+    test; the success-path tests all hit the same three endpoints, so
+    one registry activated for the module is enough. The payloads are
+    registered as pre-serialized bytes so responses skips its internal
+    json.dumps. Tests that need a conflicting registration (e.g. a 500
+    from the same URL) keep their own @responses.activate, which nests
+    cleanly over this one.
+    """
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(
+            responses.GET,
+            'https://api.openweathermap.org/data/2.5/weather',
+            body=sample_json_bytes['weather'],
+            content_type='application/json',
+            status=200
+        )
+        rsps.add(
+            responses.GET,
+            'https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd',
+            body=sample_json_bytes['bitcoin'],
+            content_type='application/json',
+            status=200
+        )
+        rsps.add(
+            responses.GET,
+            'https://blockchain.info/latestblock',
+            body=sample_json_bytes['blockchain'],
+            content_type='application/json',
+            status=200
+        )
+        yield rsps
+
+
 class TestBaseAPIManager:
     """Test the base API manager functionality."""
     
@@ -53,13 +90,13 @@ class TestBaseAPIManager:
 class TestWeatherAPIManager:
     """Test the Weather API manager."""
     
-    def test_init(self, temp_dir, mock_env_file):
+    def test_init(self, test_layout, monkeypatch):
         """Test WeatherAPIManager initialization."""
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            weather = WeatherAPIManager(config)
-            assert weather.config == config
-            assert weather.cache_key == 'weather'
+        monkeypatch.chdir(test_layout.dir)
+        config = ConfigManager()
+        weather = WeatherAPIManager(config)
+        assert weather.config == config
+        assert weather.cache_key == 'weather'
     
     def test_mock_mode_enabled(self, temp_dir):
         """Test weather API in mock mode."""
@@ -69,16 +106,15 @@ class TestWeatherAPIManager:
         with open(env_path, 'w') as f:
             f.write(env_content)
         
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            weather = WeatherAPIManager(config)
+        config = ConfigManager()
+        weather = WeatherAPIManager(config)
             
-            data = weather.get_data()
-            assert data['data_source'] == 'mock_data'
-            assert data['status'] == 'mock'
-            assert 'temperature' in data
-            assert 'condition' in data
-            assert weather.is_using_mock_data() is True
+        data = weather.get_data()
+        assert data['data_source'] == 'mock_data'
+        assert data['status'] == 'mock'
+        assert 'temperature' in data
+        assert 'condition' in data
+        assert weather.is_using_mock_data() is True
     
     def test_mock_mode_customization(self, temp_dir):
         """Test customizing mock weather data."""
@@ -93,18 +129,16 @@ class TestWeatherAPIManager:
         with open(env_path, 'w') as f:
             f.write(env_content)
         
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            weather = WeatherAPIManager(config)
+        config = ConfigManager()
+        weather = WeatherAPIManager(config)
             
-            data = weather.get_data()
-            # Should be close to configured values (within random variation)
-            assert abs(data['temperature'] - 25.5) < 2.0
-            assert data['condition'] == 'Sunny'
-            assert data['city'] == 'CustomCity'
+        data = weather.get_data()
+        # Should be close to configured values (within random variation)
+        assert abs(data['temperature'] - 25.5) < 2.0
+        assert data['condition'] == 'Sunny'
+        assert data['city'] == 'CustomCity'
     
-    @responses.activate
-    def test_real_api_mode(self, temp_dir, sample_weather_data):
+    def test_real_api_mode(self, temp_dir, mock_api_responses):
         """Test weather API with real API calls."""
         env_content = """
         WEATHER_API_KEY=real_api_key
@@ -114,25 +148,16 @@ class TestWeatherAPIManager:
         env_path = os.path.join(temp_dir, '.env')
         with open(env_path, 'w') as f:
             f.write(env_content)
-        
-        # Mock the API response
-        responses.add(
-            responses.GET,
-            'https://api.openweathermap.org/data/2.5/weather',
-            json=sample_weather_data,
-            status=200
-        )
-        
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            weather = WeatherAPIManager(config)
+
+        config = ConfigManager()
+        weather = WeatherAPIManager(config)
             
-            data = weather.get_data()
-            assert data['data_source'] == 'openweathermap_api'
-            assert data['status'] == 'success'
-            assert data['temperature'] == 22.5
-            assert data['city'] == 'TestCity'
-            assert weather.is_using_mock_data() is False
+        data = weather.get_data()
+        assert data['data_source'] == 'openweathermap_api'
+        assert data['status'] == 'success'
+        assert data['temperature'] == 22.5
+        assert data['city'] == 'TestCity'
+        assert weather.is_using_mock_data() is False
     
     def test_api_fallback_to_mock(self, temp_dir):
         """Test fallback to mock data when API fails."""
@@ -144,8 +169,7 @@ class TestWeatherAPIManager:
         with open(env_path, 'w') as f:
             f.write(env_content)
         
-        with patch('os.getcwd', return_value=temp_dir), \
-             patch('requests.Session.get', side_effect=Exception("API Error")):
+        with patch('requests.Session.get', side_effect=Exception("API Error")):
             config = ConfigManager()
             weather = WeatherAPIManager(config)
             
@@ -161,30 +185,29 @@ class TestWeatherAPIManager:
         with open(env_path, 'w') as f:
             f.write(env_content)
         
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            weather = WeatherAPIManager(config)
+        config = ConfigManager()
+        weather = WeatherAPIManager(config)
             
-            # Test helper methods
-            temp = weather.get_temperature()
-            assert isinstance(temp, (int, float))
+        # Test helper methods
+        temp = weather.get_temperature()
+        assert isinstance(temp, (int, float))
             
-            formatted_temp = weather.get_formatted_temperature()
-            assert isinstance(formatted_temp, str)
-            assert '°' in formatted_temp
+        formatted_temp = weather.get_formatted_temperature()
+        assert isinstance(formatted_temp, str)
+        assert '°' in formatted_temp
             
-            condition = weather.get_condition()
-            assert isinstance(condition, str)
+        condition = weather.get_condition()
+        assert isinstance(condition, str)
             
-            icon = weather.get_icon()
-            assert isinstance(icon, str)
+        icon = weather.get_icon()
+        assert isinstance(icon, str)
             
-            wind_info = weather.get_wind_info()
-            assert 'speed' in wind_info
-            assert 'direction' in wind_info
+        wind_info = weather.get_wind_info()
+        assert 'speed' in wind_info
+        assert 'direction' in wind_info
             
-            source_info = weather.get_data_source_info()
-            assert 'Mock' in source_info or 'API' in source_info
+        source_info = weather.get_data_source_info()
+        assert 'Mock' in source_info or 'API' in source_info
 
 
 class TestBitcoinAPIManager:
@@ -192,38 +215,21 @@ class TestBitcoinAPIManager:
     
     def test_init(self, temp_dir):
         """Test BitcoinAPIManager initialization."""
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            bitcoin = BitcoinAPIManager(config)
-            assert bitcoin.config == config
-            assert bitcoin.cache_key == 'bitcoin'
+        config = ConfigManager()
+        bitcoin = BitcoinAPIManager(config)
+        assert bitcoin.config == config
+        assert bitcoin.cache_key == 'bitcoin'
     
-    @responses.activate
-    def test_fetch_bitcoin_data(self, temp_dir, sample_bitcoin_data, sample_blockchain_data):
+    def test_fetch_bitcoin_data(self, temp_dir, mock_api_responses):
         """Test fetching Bitcoin price and blockchain data."""
-        # Mock API responses
-        responses.add(
-            responses.GET,
-            'https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd',
-            json=sample_bitcoin_data,
-            status=200
-        )
-        responses.add(
-            responses.GET,
-            'https://blockchain.info/latestblock',
-            json=sample_blockchain_data,
-            status=200
-        )
-        
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            bitcoin = BitcoinAPIManager(config)
+        config = ConfigManager()
+        bitcoin = BitcoinAPIManager(config)
             
-            data = bitcoin.get_data()
-            assert data['status'] == 'success'
-            assert data['price'] == 45000.50
-            assert data['block_height'] == 800000
-            assert 'formatted_price' in data
+        data = bitcoin.get_data()
+        assert data['status'] == 'success'
+        assert data['price'] == 45000.50
+        assert data['block_height'] == 800000
+        assert 'formatted_price' in data
     
     @responses.activate
     def test_api_error_handling(self, temp_dir):
@@ -236,13 +242,24 @@ class TestBitcoinAPIManager:
             status=500
         )
         
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            bitcoin = BitcoinAPIManager(config)
+        config = ConfigManager()
+        bitcoin = BitcoinAPIManager(config)
             
-            data = bitcoin.get_data()
-            assert data['status'] == 'error'
-            assert 'error' in data
+        data = bitcoin.get_data()
+        assert data['status'] == 'error'
+        assert 'error' in data
+
+
+# Canned Google Calendar list() payload, built once for the module
+_EVENTS_PAYLOAD = {
+    'items': [
+        {
+            'summary': 'Test Event',
+            'start': {'dateTime': '2023-12-25T10:00:00Z'},
+            'end': {'dateTime': '2023-12-25T11:00:00Z'}
+        }
+    ]
+}
 
 
 class TestCalendarAPIManager:
@@ -250,48 +267,38 @@ class TestCalendarAPIManager:
     
     def test_init(self, temp_dir):
         """Test CalendarAPIManager initialization."""
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            calendar = CalendarAPIManager(config)
-            assert calendar.config == config
-            assert calendar.cache_key == 'calendar'
+        config = ConfigManager()
+        calendar = CalendarAPIManager(config)
+        assert calendar.config == config
+        assert calendar.cache_key == 'calendar'
     
     def test_no_credentials_handling(self, temp_dir):
         """Test calendar API without credentials."""
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            calendar = CalendarAPIManager(config)
+        config = ConfigManager()
+        calendar = CalendarAPIManager(config)
             
-            data = calendar.get_data()
-            # Should handle missing credentials gracefully
-            assert 'status' in data
+        data = calendar.get_data()
+        # Should handle missing credentials gracefully
+        assert 'status' in data
     
     @patch('api.calendar_api.build')
     @patch('api.calendar_api.InstalledAppFlow')
-    def test_mock_calendar_events(self, mock_flow, mock_build, temp_dir, mock_credentials_json):
+    def test_mock_calendar_events(self, mock_flow, mock_build, temp_dir, test_layout):
         """Test calendar API with mocked Google API."""
-        env_content = f"GOOGLE_CALENDAR_CREDENTIALS_FILE={mock_credentials_json}"
+        env_content = f"GOOGLE_CALENDAR_CREDENTIALS_FILE={test_layout.creds}"
         env_path = os.path.join(temp_dir, '.env')
         with open(env_path, 'w') as f:
             f.write(env_content)
         
-        # Mock Google API service
+        # Mock Google API service; execute is a plain callable handing
+        # back the canned payload, which skips Mock's call-recording
+        # machinery on every invocation
         mock_service = Mock()
-        mock_events = Mock()
-        mock_events.list().execute.return_value = {
-            'items': [
-                {
-                    'summary': 'Test Event',
-                    'start': {'dateTime': '2023-12-25T10:00:00Z'},
-                    'end': {'dateTime': '2023-12-25T11:00:00Z'}
-                }
-            ]
-        }
-        mock_service.events.return_value = mock_events
+        mock_service.events.return_value.list.return_value.execute = \
+            lambda: _EVENTS_PAYLOAD
         mock_build.return_value = mock_service
         
-        with patch('os.getcwd', return_value=temp_dir), \
-             patch('os.path.exists', return_value=True):
+        with patch('os.path.exists', return_value=True):
             config = ConfigManager()
             calendar = CalendarAPIManager(config)
             
@@ -10,110 +10,92 @@ from config.config_manager import ConfigManager
 
 class TestConfigManager:
     """Test the ConfigManager class."""
-    
+
+    @pytest.fixture(autouse=True)
+    def _cwd(self, monkeypatch, temp_dir):
+        """Point os.getcwd at the test's temp dir for every test.
+
+        One monkeypatch setattr replaces the patch/unpatch cycle each
+        test used to run inside a `with patch('os.getcwd', ...)` block.
+        """
+        monkeypatch.setattr(os, 'getcwd', lambda: temp_dir)
+
     def test_init_without_files(self, temp_dir):
         """Test ConfigManager initialization without config files."""
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            assert config is not None
-            assert config.get('weather.city') == 'London,UK'  # Default value
-    
-    def test_load_env_file(self, temp_dir, mock_env_file):
-        """Test loading configuration from .env file."""
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            assert config.get('weather.api_key') == 'test_weather_key'
-            assert config.get('weather.city') == 'TestCity,TC'
-            assert config.get('app.fps') == 15
-            assert config.get('app.debug_mode') is True
-    
-    def test_load_json_file(self, temp_dir, mock_config_json):
+        config = ConfigManager()
+        assert config is not None
+        assert config.get('weather.city') == 'London,UK'  # Default value
+
+    @pytest.mark.parametrize("key,default,expected", [
+        # From .env
+        ("weather.api_key", None, "test_weather_key"),
+        ("weather.city", None, "TestCity,TC"),
+        ("app.fps", None, 15),
+        ("app.debug_mode", None, True),
+        # Only in JSON, not overridden by env
+        ("display.brightness", None, 80),
+        # Default handling
+        ("nonexistent.key", "default_value", "default_value"),
+        ("weather.city", "fallback", "TestCity,TC"),
+    ])
+    def test_config_values(self, loaded_config, key, default, expected):
+        """Table-driven lookups against the shared ConfigManager.
+
+        Replaces the near-identical env-file / nested / override /
+        default tests, which each rebuilt a ConfigManager to assert on
+        one or two keys.
+        """
+        assert loaded_config.get(key, default) == expected
+
+    def test_load_json_file(self, mock_config_json):
         """Test loading configuration from JSON file."""
         # Remove .env file to test JSON loading
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            assert config.get('weather.api_key') == 'json_weather_key'
-            assert config.get('weather.city') == 'JsonCity,JC'
-            assert config.get('weather.units') == 'imperial'
-    
-    def test_env_overrides_json(self, temp_dir, mock_env_file, mock_config_json):
-        """Test that environment variables override JSON configuration."""
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            # Env should override JSON
-            assert config.get('weather.api_key') == 'test_weather_key'  # From .env
-            assert config.get('weather.city') == 'TestCity,TC'  # From .env
-            # Values only in JSON should still be available
-            assert config.get('display.brightness') == 80  # From JSON only
-    
-    def test_get_with_default(self, temp_dir):
-        """Test getting configuration values with defaults."""
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            assert config.get('nonexistent.key', 'default_value') == 'default_value'
-            assert config.get('weather.city', 'fallback') == 'London,UK'  # Has default
-    
+        config = ConfigManager()
+        assert config.get('weather.api_key') == 'json_weather_key'
+        assert config.get('weather.city') == 'JsonCity,JC'
+        assert config.get('weather.units') == 'imperial'
+
     def test_set_configuration(self, temp_dir):
         """Test setting configuration values."""
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            config.set('test.key', 'test_value')
-            assert config.get('test.key') == 'test_value'
-    
-    def test_nested_configuration(self, temp_dir, mock_env_file):
-        """Test accessing nested configuration values."""
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            assert config.get('weather.api_key') == 'test_weather_key'
-            assert config.get('app.fps') == 15
-    
-    def test_get_config_status(self, temp_dir, mock_env_file):
+        config = ConfigManager()
+        config.set('test.key', 'test_value')
+        assert config.get('test.key') == 'test_value'
+
+    def test_get_config_status(self, loaded_config):
         """Test configuration status reporting."""
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            status = config.get_config_status()
-            
-            assert 'env_file_exists' in status
-            assert 'json_file_exists' in status
-            assert 'dotenv_available' in status
-            assert 'config_sources' in status
-            assert status['env_file_exists'] is True
-    
-    def test_validate_configuration(self, temp_dir, mock_env_file):
+        status = loaded_config.get_config_status()
+
+        assert 'env_file_exists' in status
+        assert 'json_file_exists' in status
+        assert 'dotenv_available' in status
+        assert 'config_sources' in status
+        assert status['env_file_exists'] is True
+
+    def test_validate_configuration(self, loaded_config):
         """Test configuration validation."""
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            warnings = config.validate_configuration()
-            
-            # Should be a list of warning strings
-            assert isinstance(warnings, list)
-    
-    def test_is_env_configured(self, temp_dir, mock_env_file):
+        warnings = loaded_config.validate_configuration()
+
+        # Should be a list of warning strings
+        assert isinstance(warnings, list)
+
+    def test_is_env_configured(self, loaded_config):
         """Test environment configuration detection."""
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            assert config.is_env_configured() is True
-    
+        assert loaded_config.is_env_configured() is True
+
     def test_dotenv_import_error(self, temp_dir):
         """Test handling when python-dotenv is not available."""
-        with patch('os.getcwd', return_value=temp_dir), \
-             patch.dict('sys.modules', {'dotenv': None}):
+        with patch.dict('sys.modules', {'dotenv': None}):
             config = ConfigManager()
             status = config.get_config_status()
             assert status['dotenv_available'] is False
-    
-    def test_invalid_json_file(self, temp_dir):
+
+    def test_invalid_json_file(self, invalid_json_dir, monkeypatch):
         """Test handling of invalid JSON configuration file."""
-        # Create invalid JSON file
-        invalid_json_path = os.path.join(temp_dir, 'config.json')
-        with open(invalid_json_path, 'w') as f:
-            f.write('{ invalid json }')
-        
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            # Should fall back to defaults without crashing
-            assert config.get('weather.city') == 'London,UK'
-    
+        monkeypatch.setattr(os, 'getcwd', lambda: invalid_json_dir)
+        config = ConfigManager()
+        # Should fall back to defaults without crashing
+        assert config.get('weather.city') == 'London,UK'
+
     def test_type_conversion(self, temp_dir):
         """Test automatic type conversion of environment variables."""
         env_content = """
@@ -126,10 +108,9 @@ class TestConfigManager:
         env_path = os.path.join(temp_dir, '.env')
         with open(env_path, 'w') as f:
             f.write(env_content)
-        
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            # Note: Environment variables are typically strings,
-            # conversion depends on implementation
-            assert config.get('test_int') is not None
-            assert config.get('test_string') is not None 
\ No newline at end of file
+
+        config = ConfigManager()
+        # Note: Environment variables are typically strings,
+        # conversion depends on implementation
+        assert config.get('test_int') is not None
+        assert config.get('test_string') is not None
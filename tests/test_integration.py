@@ -20,7 +20,7 @@ from api.bitcoin_api import BitcoinAPIManager
 class TestConfigurationIntegration:
     """Test configuration system integration."""
     
-    def test_config_priority_chain(self, temp_dir):
+    def test_config_priority_chain(self, temp_dir, env):
         """Test configuration priority: env vars > JSON > defaults."""
         # Create JSON config
         json_content = '''
@@ -36,87 +36,72 @@ class TestConfigurationIntegration:
         '''
         with open(os.path.join(temp_dir, 'config.json'), 'w') as f:
             f.write(json_content)
-        
-        # Create .env file that overrides some JSON values
-        env_content = """
-        WEATHER_API_KEY=env_key
-        WEATHER_CITY=EnvCity,EC
-        # Note: fps not set in env, should come from JSON
-        """
-        with open(os.path.join(temp_dir, '.env'), 'w') as f:
-            f.write(env_content)
-        
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            
-            # Env should override JSON
-            assert config.get('weather.api_key') == 'env_key'
-            assert config.get('weather.city') == 'EnvCity,EC'
-            
-            # JSON should be used when env doesn't have the value
-            assert config.get('app.fps') == 25
-            
-            # Defaults should be used when neither has the value
-            assert config.get('weather.units') == 'metric'
+
+        # Env values that override some JSON values; fps is not set in
+        # env, so it should come from JSON
+        env.update({
+            'WEATHER_API_KEY': 'env_key',
+            'WEATHER_CITY': 'EnvCity,EC',
+        })
+
+        config = ConfigManager()
+
+        # Env should override JSON
+        assert config.get('weather.api_key') == 'env_key'
+        assert config.get('weather.city') == 'EnvCity,EC'
+
+        # JSON should be used when env doesn't have the value
+        assert config.get('app.fps') == 25
+
+        # Defaults should be used when neither has the value
+        assert config.get('weather.units') == 'metric'
     
-    def test_complete_configuration_workflow(self, temp_dir, mock_credentials_json):
+    def test_complete_configuration_workflow(self, env, mock_credentials_json):
         """Test complete configuration setup with all components."""
-        env_content = f"""
-        # Weather configuration
-        WEATHER_API_KEY=test_weather_key
-        WEATHER_CITY=TestCity,TC
-        WEATHER_MOCK_MODE=false
-        
-        # Google Calendar
-        GOOGLE_CALENDAR_CREDENTIALS_FILE={mock_credentials_json}
-        
-        # App settings
-        API_UPDATE_INTERVAL=60
-        DEBUG_MODE=true
-        """
-        with open(os.path.join(temp_dir, '.env'), 'w') as f:
-            f.write(env_content)
-        
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            
-            # Verify all configurations are loaded correctly
-            status = config.get_config_status()
-            assert status['env_file_exists'] is True
-            assert status['weather_api_configured'] is True
-            
-            # Verify runtime constants
-            from utils.constants import get_runtime_constants
-            runtime = get_runtime_constants(config)
-            assert runtime['UPDATE_INTERVAL'] == 60
-            assert runtime['DEBUG_MODE'] is True
+        env.update({
+            # Weather configuration
+            'WEATHER_API_KEY': 'test_weather_key',
+            'WEATHER_CITY': 'TestCity,TC',
+            'WEATHER_MOCK_MODE': 'false',
+            # Google Calendar
+            'GOOGLE_CALENDAR_CREDENTIALS_FILE': mock_credentials_json,
+            # App settings
+            'API_UPDATE_INTERVAL': '60',
+            'DEBUG_MODE': 'true',
+        })
+
+        config = ConfigManager()
+
+        # Verify all configurations are loaded correctly
+        status = config.get_config_status()
+        assert status['env_file_exists'] is True
+        assert status['weather_api_configured'] is True
+
+        # Verify runtime constants
+        from utils.constants import get_runtime_constants
+        runtime = get_runtime_constants(config)
+        assert runtime['UPDATE_INTERVAL'] == 60
+        assert runtime['DEBUG_MODE'] is True
 
 
 class TestAPIIntegration:
     """Test API managers working together."""
     
-    def test_weather_api_with_config_integration(self, temp_dir):
+    def test_weather_api_with_config_integration(self, config):
         """Test WeatherAPI with ConfigManager integration."""
-        env_content = """
-        WEATHER_MOCK_MODE=true
-        WEATHER_MOCK_TEMPERATURE=20.5
-        WEATHER_CITY=IntegrationCity,IC
-        """
-        with open(os.path.join(temp_dir, '.env'), 'w') as f:
-            f.write(env_content)
-        
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            weather_api = WeatherAPIManager(config)
-            
-            data = weather_api.get_data()
-            
-            assert data['data_source'] == 'mock_data'
-            assert data['city'] == 'IntegrationCity'
-            assert abs(data['temperature'] - 20.5) < 2.0  # Within variation range
+        config.set('weather.mock_mode', True)
+        config.set('weather.mock_temperature', 20.5)
+        config.set('weather.city', 'IntegrationCity,IC')
+        weather_api = WeatherAPIManager(config)
+
+        data = weather_api.get_data()
+
+        assert data['data_source'] == 'mock_data'
+        assert data['city'] == 'IntegrationCity'
+        assert abs(data['temperature'] - 20.5) < 2.0  # Within variation range
     
     @responses.activate
-    def test_multiple_api_managers(self, temp_dir, sample_weather_data, sample_bitcoin_data):
+    def test_multiple_api_managers(self, temp_dir, sample_json_bytes):
         """Test multiple API managers working simultaneously."""
         env_content = """
         WEATHER_API_KEY=test_key
@@ -129,13 +114,15 @@ class TestAPIIntegration:
         responses.add(
             responses.GET,
             'https://api.openweathermap.org/data/2.5/weather',
-            json=sample_weather_data,
+            body=sample_json_bytes['weather'],
+            content_type='application/json',
             status=200
         )
         responses.add(
             responses.GET,
             'https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd',
-            json=sample_bitcoin_data,
+            body=sample_json_bytes['bitcoin'],
+            content_type='application/json',
             status=200
         )
         responses.add(
@@ -145,48 +132,44 @@ class TestAPIIntegration:
             status=200
         )
         
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            weather_api = WeatherAPIManager(config)
-            bitcoin_api = BitcoinAPIManager(config)
+        config = ConfigManager()
+        weather_api = WeatherAPIManager(config)
+        bitcoin_api = BitcoinAPIManager(config)
             
-            weather_data = weather_api.get_data()
-            bitcoin_data = bitcoin_api.get_data()
+        weather_data = weather_api.get_data()
+        bitcoin_data = bitcoin_api.get_data()
             
-            assert weather_data['status'] == 'success'
-            assert bitcoin_data['status'] == 'success'
-            assert weather_data['temperature'] == 22.5
-            assert bitcoin_data['price'] == 45000.50
+        assert weather_data['status'] == 'success'
+        assert bitcoin_data['status'] == 'success'
+        assert weather_data['temperature'] == 22.5
+        assert bitcoin_data['price'] == 45000.50
     
-    def test_api_caching_integration(self, temp_dir):
+    def test_api_caching_integration(self, env):
         """Test API caching across multiple requests."""
-        env_content = "WEATHER_MOCK_MODE=true"
-        with open(os.path.join(temp_dir, '.env'), 'w') as f:
-            f.write(env_content)
-        
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            weather_api = WeatherAPIManager(config)
-            
-            # First request
-            data1 = weather_api.get_data()
-            
-            # Second request (should be cached)
-            data2 = weather_api.get_data()
-            
-            # Should get the same exact data (including timestamp)
-            assert data1['last_updated'] == data2['last_updated']
-            assert data1['temperature'] == data2['temperature']
-            
-            # Cache info should indicate data is fresh
-            cache_info = weather_api.get_cache_info()
-            assert cache_info['is_expired'] is False
+        env['WEATHER_MOCK_MODE'] = 'true'
+
+        config = ConfigManager()
+        weather_api = WeatherAPIManager(config)
+
+        # First request
+        data1 = weather_api.get_data()
+
+        # Second request (should be cached)
+        data2 = weather_api.get_data()
+
+        # Should get the same exact data (including timestamp)
+        assert data1['last_updated'] == data2['last_updated']
+        assert data1['temperature'] == data2['temperature']
+
+        # Cache info should indicate data is fresh
+        cache_info = weather_api.get_cache_info()
+        assert cache_info['is_expired'] is False
 
 
 class TestScreenIntegration:
     """Test screen components integration."""
     
-    def test_screen_with_api_integration(self, temp_dir, mock_pygame):
+    def test_screen_with_api_integration(self, temp_dir, mock_pygame, make_fake_app):
         """Test screens working with their respective APIs."""
         env_content = """
         WEATHER_MOCK_MODE=true
@@ -195,16 +178,11 @@ class TestScreenIntegration:
         with open(os.path.join(temp_dir, '.env'), 'w') as f:
             f.write(env_content)
         
-        with patch('os.getcwd', return_value=temp_dir), \
-             patch('pygame.font.Font'):
-            
-            # Create mock app
-            mock_app = Mock()
-            mock_app.screen = mock_pygame
-            mock_app.config_manager = ConfigManager()
+        with patch('pygame.font.Font'):
+            fake_app = make_fake_app(ConfigManager())
             
             from screens.weather_screen import WeatherScreen
-            weather_screen = WeatherScreen(mock_app)
+            weather_screen = WeatherScreen(fake_app)
             
             # Update should fetch data
             weather_screen.update()
@@ -216,15 +194,10 @@ class TestScreenIntegration:
             data = weather_screen.weather_api.get_data()
             assert data['city'] == 'ScreenTest'
     
-    def test_all_screens_initialization(self, temp_dir, mock_pygame):
+    def test_all_screens_initialization(self, temp_dir, make_fake_app):
         """Test that all screens can be initialized together."""
-        with patch('os.getcwd', return_value=temp_dir), \
-             patch('pygame.font.Font'):
-            
-            # Create mock app
-            mock_app = Mock()
-            mock_app.screen = mock_pygame
-            mock_app.config_manager = ConfigManager()
+        with patch('pygame.font.Font'):
+            fake_app = make_fake_app(ConfigManager())
             
             # Import all screen classes
             from screens.clock_calendar_screen import ClockCalendarScreen
@@ -234,10 +207,10 @@ class TestScreenIntegration:
             
             # Initialize all screens
             screens = [
-                ClockCalendarScreen(mock_app),
-                WeatherScreen(mock_app),
-                BitcoinScreen(mock_app),
-                SystemStatsScreen(mock_app)
+                ClockCalendarScreen(fake_app),
+                WeatherScreen(fake_app),
+                BitcoinScreen(fake_app),
+                SystemStatsScreen(fake_app)
             ]
             
             # All screens should initialize without errors
@@ -254,121 +227,101 @@ class TestScreenIntegration:
 
 class TestFullApplicationIntegration:
     """Test the complete application workflow."""
-    
-    def test_app_initialization_workflow(self, temp_dir, mock_pygame):
-        """Test complete application initialization."""
-        env_content = """
-        WEATHER_MOCK_MODE=true
-        DEBUG_MODE=true
-        APP_FPS=15
+
+    @pytest.fixture(scope="class")
+    def full_app(self, pygame_patches, tmp_path_factory):
+        """One DashboardApp for the class, built over a mock-mode .env.
+
+        Constructing the app pulls in all four screens, the API
+        managers and a ConfigManager; these tests only poke at the
+        resulting instance, so they share one build.
         """
-        with open(os.path.join(temp_dir, '.env'), 'w') as f:
-            f.write(env_content)
-        
-        with patch('os.getcwd', return_value=temp_dir), \
-             patch('pygame.init'), \
-             patch('pygame.display.set_mode', return_value=mock_pygame), \
-             patch('pygame.time.Clock'), \
-             patch('threading.Thread'), \
-             patch('pygame.font.Font'):
-            
-            app = DashboardApp()
-            
-            # Verify initialization
-            assert app.config_manager is not None
-            assert app.runtime_config is not None
-            assert len(app.screens) == 4
-            assert len(app.api_managers) > 0
-            
-            # Verify configuration loaded correctly
-            assert app.runtime_config['DEBUG_MODE'] is True
-            assert app.runtime_config['FPS'] == 15
-    
-    def test_screen_navigation_integration(self, temp_dir, mock_pygame):
+        path = tmp_path_factory.mktemp('full_app')
+        with open(os.path.join(str(path), '.env'), 'w') as f:
+            f.write("WEATHER_MOCK_MODE=true\nDEBUG_MODE=true\nAPP_FPS=15\n")
+
+        old_cwd = os.getcwd()
+        os.chdir(str(path))
+        try:
+            return DashboardApp()
+        finally:
+            os.chdir(old_cwd)
+
+    @pytest.fixture
+    def app(self, full_app):
+        """Snapshot/restore the mutable app state around each test."""
+        state = (full_app.current_screen_index, full_app.running,
+                 dict(full_app.runtime_config),
+                 full_app.touch_handler.swipe_threshold)
+        yield full_app
+        full_app.current_screen_index, full_app.running = state[0], state[1]
+        full_app.runtime_config = state[2]
+        full_app.touch_handler.swipe_threshold = state[3]
+
+    def test_app_initialization_workflow(self, app):
+        """Test complete application initialization."""
+        # Verify initialization
+        assert app.config_manager is not None
+        assert app.runtime_config is not None
+        assert len(app.screens) == 4
+        assert len(app.api_managers) > 0
+
+        # Verify configuration loaded correctly
+        assert app.runtime_config['DEBUG_MODE'] is True
+        assert app.runtime_config['FPS'] == 15
+
+    def test_screen_navigation_integration(self, app, mock_pygame):
         """Test screen navigation with touch events."""
-        with patch('os.getcwd', return_value=temp_dir), \
-             patch('pygame.init'), \
-             patch('pygame.display.set_mode', return_value=mock_pygame), \
-             patch('pygame.time.Clock'), \
-             patch('threading.Thread'), \
-             patch('pygame.font.Font'):
-            
-            app = DashboardApp()
-            
-            initial_screen = app.current_screen_index
-            
-            # Simulate swipe right
-            app._handle_swipe('swipe_right')
-            new_screen = app.current_screen_index
-            
-            assert new_screen == (initial_screen + 1) % len(app.screens)
-            
-            # Get current screen and verify it's functional
+        initial_screen = app.current_screen_index
+
+        # Simulate swipe right
+        app._handle_swipe('swipe_right')
+        new_screen = app.current_screen_index
+
+        assert new_screen == (initial_screen + 1) % len(app.screens)
+
+        # Get current screen and verify it's functional
+        current_screen = app.get_current_screen()
+        assert current_screen is not None
+
+        # Screen should be able to update and draw
+        current_screen.update()
+        current_screen.draw(mock_pygame)
+
+    def test_error_recovery_integration(self, app, mock_pygame):
+        """Test application error recovery mechanisms."""
+        # Simulate API error in weather
+        with patch.object(app.weather_api, 'get_data',
+                        return_value={'status': 'error', 'error': 'Test error'}):
+
+            # Should still be able to get current screen and draw
             current_screen = app.get_current_screen()
-            assert current_screen is not None
-            
-            # Screen should be able to update and draw
             current_screen.update()
             current_screen.draw(mock_pygame)
-    
-    def test_error_recovery_integration(self, temp_dir, mock_pygame):
-        """Test application error recovery mechanisms."""
-        with patch('os.getcwd', return_value=temp_dir), \
-             patch('pygame.init'), \
-             patch('pygame.display.set_mode', return_value=mock_pygame), \
-             patch('pygame.time.Clock'), \
-             patch('threading.Thread'), \
-             patch('pygame.font.Font'):
-            
-            app = DashboardApp()
-            
-            # Simulate API error in weather
-            with patch.object(app.weather_api, 'get_data', 
-                            return_value={'status': 'error', 'error': 'Test error'}):
-                
-                # Should still be able to get current screen and draw
-                current_screen = app.get_current_screen()
-                current_screen.update()
-                current_screen.draw(mock_pygame)
-                
-                # App should still be functional
-                app_status = app.get_app_status()
-                assert app_status['running'] is True
-    
-    def test_configuration_reload_integration(self, temp_dir, mock_pygame):
+
+            # App should still be functional
+            app_status = app.get_app_status()
+            assert app_status['running'] is True
+
+    def test_configuration_reload_integration(self, app):
         """Test configuration changes during runtime."""
-        env_content = """
-        WEATHER_MOCK_MODE=true
-        TOUCH_SWIPE_THRESHOLD=100
-        """
-        with open(os.path.join(temp_dir, '.env'), 'w') as f:
-            f.write(env_content)
-        
-        with patch('os.getcwd', return_value=temp_dir), \
-             patch('pygame.init'), \
-             patch('pygame.display.set_mode', return_value=mock_pygame), \
-             patch('pygame.time.Clock'), \
-             patch('threading.Thread'), \
-             patch('pygame.font.Font'):
-            
-            app = DashboardApp()
-            
-            # Initial threshold
-            initial_threshold = app.touch_handler.swipe_threshold
-            
-            # Update configuration
-            app.config_manager.set('app.touch_swipe_threshold', 150)
-            app.touch_handler.update_config()
-            
-            # Should reflect new configuration
-            new_threshold = app.touch_handler.swipe_threshold
-            assert new_threshold != initial_threshold
+        # Initial threshold
+        initial_threshold = app.touch_handler.swipe_threshold
+
+        # Update configuration
+        app.config_manager.set('app.touch_swipe_threshold',
+                               initial_threshold + 50)
+        app.touch_handler.update_config(app.config_manager)
+
+        # Should reflect new configuration
+        new_threshold = app.touch_handler.swipe_threshold
+        assert new_threshold != initial_threshold
 
 
 class TestDataFlowIntegration:
     """Test data flow between components."""
     
-    def test_config_to_api_to_screen_flow(self, temp_dir, mock_pygame):
+    def test_config_to_api_to_screen_flow(self, temp_dir, mock_pygame, make_fake_app):
         """Test data flowing from config through API to screen."""
         env_content = """
         WEATHER_MOCK_MODE=true
@@ -378,8 +331,7 @@ class TestDataFlowIntegration:
         with open(os.path.join(temp_dir, '.env'), 'w') as f:
             f.write(env_content)
         
-        with patch('os.getcwd', return_value=temp_dir), \
-             patch('pygame.font.Font'):
+        with patch('pygame.font.Font'):
             
             # Create config
             config = ConfigManager()
@@ -389,12 +341,8 @@ class TestDataFlowIntegration:
             data = weather_api.get_data()
             
             # Create screen with API
-            mock_app = Mock()
-            mock_app.screen = mock_pygame
-            mock_app.config_manager = config
-            
             from screens.weather_screen import WeatherScreen
-            screen = WeatherScreen(mock_app)
+            screen = WeatherScreen(make_fake_app(config))
             
             # Data should flow through: config -> API -> screen
             screen_data = screen.weather_api.get_data()
@@ -402,22 +350,22 @@ class TestDataFlowIntegration:
             assert screen_data['city'] == 'FlowTest'
             assert abs(screen_data['temperature'] - 25.0) < 2.0
     
+    @pytest.mark.xdist_group("cache_state")
     def test_cache_persistence_across_components(self, temp_dir):
         """Test that cache persists across different component instances."""
         env_content = "WEATHER_MOCK_MODE=true"
         with open(os.path.join(temp_dir, '.env'), 'w') as f:
             f.write(env_content)
         
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
+        config = ConfigManager()
             
-            # Create first API instance and get data
-            api1 = WeatherAPIManager(config)
-            data1 = api1.get_data()
+        # Create first API instance and get data
+        api1 = WeatherAPIManager(config)
+        data1 = api1.get_data()
             
-            # Create second API instance
-            api2 = WeatherAPIManager(config)
-            data2 = api2.get_data()
+        # Create second API instance
+        api2 = WeatherAPIManager(config)
+        data2 = api2.get_data()
             
-            # Should get cached data (same timestamp)
-            assert data1['last_updated'] == data2['last_updated'] 
\ No newline at end of file
+        # Should get cached data (same timestamp)
+        assert data1['last_updated'] == data2['last_updated'] 
\ No newline at end of file
@@ -2,47 +2,86 @@
 Tests for utility components (SystemMonitor, constants).
 """
 
+import io
 import pytest
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import Mock, patch
+from utils import system_monitor
 from utils.system_monitor import SystemMonitor
 from utils.constants import get_runtime_constants, WEATHER_ICONS, MOCK_WEATHER_DATA
 from config.config_manager import ConfigManager
 import os
 
+# Checked-in .env fixture consumed via ConfigManager's env_file
+# override, so tests don't rebuild it on disk per run
+_RUNTIME_CONSTANTS_ENV = os.path.join(
+    os.path.dirname(__file__), 'fixtures', 'runtime_constants.env')
+
+
+class _FakeOpen:
+    """Callable stand-in for builtins.open backed by a canned string.
+
+    mock_open wires readline/readlines/__iter__ onto a fresh MagicMock
+    for every call; a StringIO already is a file object, so this skips
+    the mock machinery entirely on the hot read paths.
+    """
+
+    def __init__(self, data=None, exc=None):
+        self.data = data
+        self.exc = exc
+
+    def __call__(self, *args, **kwargs):
+        if self.exc is not None:
+            raise self.exc
+        return io.StringIO(self.data)
+
 
 class TestSystemMonitor:
     """Test the SystemMonitor functionality."""
-    
-    @patch('builtins.open', mock_open(read_data='45678\n'))
+
+    @pytest.fixture(autouse=True)
+    def _fresh_stats_cache(self):
+        """Keep the TTL-cached getters from leaking values between tests."""
+        system_monitor._stats_cache.clear()
+
+    @patch('builtins.open', _FakeOpen('45678\n'))
     def test_get_cpu_temperature(self):
         """Test getting CPU temperature."""
         temp = SystemMonitor.get_cpu_temperature()
         assert temp == 45.678
     
-    @patch('builtins.open', side_effect=FileNotFoundError)
+    @patch('builtins.open', _FakeOpen(exc=FileNotFoundError))
     def test_get_cpu_temperature_file_not_found(self):
         """Test CPU temperature when thermal file doesn't exist."""
         temp = SystemMonitor.get_cpu_temperature()
         assert temp == 0.0
     
-    @patch('builtins.open', mock_open(read_data='invalid_data'))
+    @patch('builtins.open', _FakeOpen('invalid_data'))
     def test_get_cpu_temperature_invalid_data(self):
         """Test CPU temperature with invalid data."""
         temp = SystemMonitor.get_cpu_temperature()
         assert temp == 0.0
     
     @patch('psutil.cpu_percent', return_value=25.5)
-    def test_get_cpu_usage(self, mock_cpu_percent):
-        """Test getting CPU usage."""
+    def test_get_cpu_usage(self, mock_cpu_percent, monkeypatch):
+        """Test getting CPU usage via the psutil fallback."""
+        monkeypatch.setattr(system_monitor, '_STAT_FD', None)
         usage = SystemMonitor.get_cpu_usage()
         assert usage == 25.5
         mock_cpu_percent.assert_called_once()
-    
+
     @patch('psutil.cpu_percent', side_effect=Exception("psutil error"))
-    def test_get_cpu_usage_error(self, mock_cpu_percent):
+    def test_get_cpu_usage_error(self, mock_cpu_percent, monkeypatch):
         """Test CPU usage with psutil error."""
+        monkeypatch.setattr(system_monitor, '_STAT_FD', None)
         usage = SystemMonitor.get_cpu_usage()
         assert usage == 0.0
+
+    @pytest.mark.skipif(system_monitor._STAT_FD is None,
+                        reason="/proc/stat not available")
+    def test_get_cpu_usage_procfs(self):
+        """Test the /proc/stat fast path returns a sane percentage."""
+        usage = SystemMonitor.get_cpu_usage()
+        assert 0.0 <= usage <= 100.0
     
     @patch('psutil.virtual_memory')
     def test_get_memory_usage(self, mock_virtual_memory):
@@ -127,62 +166,62 @@ class TestSystemMonitor:
     @patch('os.path.exists', return_value=True)
     def test_is_raspberry_pi_true(self, mock_exists):
         """Test Raspberry Pi detection when it is a Pi."""
-        with patch('builtins.open', mock_open(read_data='Raspberry Pi 4 Model B Rev 1.4')):
+        SystemMonitor.is_raspberry_pi.cache_clear()
+        with patch('builtins.open', _FakeOpen('Raspberry Pi 4 Model B Rev 1.4')):
             assert SystemMonitor.is_raspberry_pi() is True
-    
+
     @patch('os.path.exists', return_value=False)
     def test_is_raspberry_pi_false_no_file(self, mock_exists):
         """Test Raspberry Pi detection when cpuinfo file doesn't exist."""
+        SystemMonitor.is_raspberry_pi.cache_clear()
         assert SystemMonitor.is_raspberry_pi() is False
-    
+
     @patch('os.path.exists', return_value=True)
     def test_is_raspberry_pi_false_wrong_content(self, mock_exists):
         """Test Raspberry Pi detection on non-Pi hardware."""
-        with patch('builtins.open', mock_open(read_data='Intel(R) Core(TM) i7')):
+        SystemMonitor.is_raspberry_pi.cache_clear()
+        with patch('builtins.open', _FakeOpen('Intel(R) Core(TM) i7')):
             assert SystemMonitor.is_raspberry_pi() is False
     
-    def test_get_complete_stats(self):
+    def test_get_complete_stats(self, monkeypatch):
         """Test getting complete system statistics."""
-        with patch.multiple(
-            'utils.system_monitor.SystemMonitor',
-            get_cpu_temperature=Mock(return_value=45.2),
-            get_cpu_usage=Mock(return_value=15.5),
-            get_memory_usage=Mock(return_value=35.8),
-            get_disk_usage=Mock(return_value=12.3),
-            get_uptime=Mock(return_value=86400),
-            format_uptime=Mock(return_value="1 day, 0:00:00"),
-            get_network_usage=Mock(return_value={'bytes_sent_mb': 1.0, 'bytes_recv_mb': 2.0}),
-            is_raspberry_pi=Mock(return_value=True)
-        ):
-            stats = SystemMonitor.get_complete_stats()
-            
-            assert 'cpu_temp' in stats
-            assert 'cpu_usage' in stats
-            assert 'memory_usage' in stats
-            assert 'disk_usage' in stats
-            assert 'uptime_seconds' in stats
-            assert 'uptime_formatted' in stats
-            assert 'network' in stats
-            assert 'is_raspberry_pi' in stats
-            
-            assert stats['cpu_temp'] == 45.2
-            assert stats['cpu_usage'] == 15.5
-            assert stats['is_raspberry_pi'] is True
-    
-    def test_get_health_status(self):
+        monkeypatch.setattr(SystemMonitor, 'get_cpu_temperature', staticmethod(lambda: 45.2))
+        monkeypatch.setattr(SystemMonitor, 'get_cpu_usage', staticmethod(lambda: 15.5))
+        monkeypatch.setattr(SystemMonitor, 'get_memory_usage', staticmethod(lambda: 35.8))
+        monkeypatch.setattr(SystemMonitor, 'get_disk_usage', staticmethod(lambda path='/': 12.3))
+        monkeypatch.setattr(SystemMonitor, 'get_uptime', staticmethod(lambda: 86400))
+        monkeypatch.setattr(SystemMonitor, 'format_uptime', staticmethod(lambda s: "1 day, 0:00:00"))
+        monkeypatch.setattr(SystemMonitor, 'get_network_usage',
+                            staticmethod(lambda: {'bytes_sent_mb': 1.0, 'bytes_recv_mb': 2.0}))
+        monkeypatch.setattr(SystemMonitor, 'is_raspberry_pi', staticmethod(lambda: True))
+
+        stats = SystemMonitor.get_complete_stats()
+
+        assert 'cpu_temp' in stats
+        assert 'cpu_usage' in stats
+        assert 'memory_usage' in stats
+        assert 'disk_usage' in stats
+        assert 'uptime_seconds' in stats
+        assert 'uptime_formatted' in stats
+        assert 'network' in stats
+        assert 'is_raspberry_pi' in stats
+
+        assert stats['cpu_temp'] == 45.2
+        assert stats['cpu_usage'] == 15.5
+        assert stats['is_raspberry_pi'] is True
+
+    def test_get_health_status(self, monkeypatch):
         """Test getting system health status."""
-        with patch.multiple(
-            'utils.system_monitor.SystemMonitor',
-            get_cpu_temperature=Mock(return_value=45.2),
-            get_cpu_usage=Mock(return_value=15.5),
-            get_memory_usage=Mock(return_value=35.8)
-        ):
-            health = SystemMonitor.get_health_status()
-            
-            assert 'overall_status' in health
-            assert 'warnings' in health
-            assert 'critical_issues' in health
-            assert health['overall_status'] in ['good', 'warning', 'critical']
+        monkeypatch.setattr(SystemMonitor, 'get_cpu_temperature', staticmethod(lambda: 45.2))
+        monkeypatch.setattr(SystemMonitor, 'get_cpu_usage', staticmethod(lambda: 15.5))
+        monkeypatch.setattr(SystemMonitor, 'get_memory_usage', staticmethod(lambda: 35.8))
+
+        health = SystemMonitor.get_health_status()
+
+        assert 'overall_status' in health
+        assert 'warnings' in health
+        assert 'critical_issues' in health
+        assert health['overall_status'] in ['good', 'warning', 'critical']
 
 
 class TestConstants:
@@ -197,54 +236,52 @@ class TestConstants:
     
     def test_mock_weather_data_structure(self):
         """Test that mock weather data has correct structure."""
-        assert isinstance(MOCK_WEATHER_DATA, list)
+        assert isinstance(MOCK_WEATHER_DATA, tuple)
         assert len(MOCK_WEATHER_DATA) > 0
-        
+
         for weather_item in MOCK_WEATHER_DATA:
-            assert 'condition' in weather_item
-            assert 'temperature' in weather_item
-            assert 'humidity' in weather_item
-            assert 'wind_speed' in weather_item
-            assert isinstance(weather_item['temperature'], (int, float))
-            assert isinstance(weather_item['humidity'], int)
+            assert weather_item.condition
+            assert weather_item.description
+            assert isinstance(weather_item.temperature, (int, float))
+            assert isinstance(weather_item.humidity, int)
+            assert isinstance(weather_item.wind_speed, (int, float))
     
+    def test_no_duplicate_constants_file(self):
+        """Test that exactly one constants module exists in the project."""
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        found = []
+        for dirpath, dirnames, filenames in os.walk(project_root):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.') and d != '__pycache__']
+            if 'constants.py' in filenames:
+                found.append(os.path.join(dirpath, 'constants.py'))
+
+        assert found == [os.path.join(project_root, 'utils', 'constants.py')]
+
     def test_get_runtime_constants(self, temp_dir):
         """Test getting runtime constants from configuration."""
-        env_content = """
-        APP_FPS=60
-        TOUCH_SWIPE_THRESHOLD=75
-        API_UPDATE_INTERVAL=180
-        SYSTEM_UPDATE_INTERVAL=3
-        DEBUG_MODE=true
-        """
-        env_path = os.path.join(temp_dir, '.env')
-        with open(env_path, 'w') as f:
-            f.write(env_content)
-        
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            constants = get_runtime_constants(config)
-            
-            assert 'FPS' in constants
-            assert 'SWIPE_THRESHOLD' in constants
-            assert 'UPDATE_INTERVAL' in constants
-            assert 'SYSTEM_UPDATE_INTERVAL' in constants
-            assert 'DEBUG_MODE' in constants
-            
-            assert constants['FPS'] == 60
-            assert constants['SWIPE_THRESHOLD'] == 75
-            assert constants['UPDATE_INTERVAL'] == 180
-            assert constants['DEBUG_MODE'] is True
+        # Checked-in fixture file; nothing is written at test time
+        config = ConfigManager(env_file=_RUNTIME_CONSTANTS_ENV)
+        constants = get_runtime_constants(config)
+
+        assert 'FPS' in constants
+        assert 'SWIPE_THRESHOLD' in constants
+        assert 'UPDATE_INTERVAL' in constants
+        assert 'SYSTEM_UPDATE_INTERVAL' in constants
+        assert 'DEBUG_MODE' in constants
+
+        assert constants['FPS'] == 60
+        assert constants['SWIPE_THRESHOLD'] == 75
+        assert constants['UPDATE_INTERVAL'] == 180
+        assert constants['DEBUG_MODE'] is True
     
     def test_get_runtime_constants_defaults(self, temp_dir):
         """Test getting runtime constants with default values."""
-        with patch('os.getcwd', return_value=temp_dir):
-            config = ConfigManager()
-            constants = get_runtime_constants(config)
+        config = ConfigManager()
+        constants = get_runtime_constants(config)
             
-            # Should use default values when no config provided
-            assert constants['FPS'] == 30  # DEFAULT_FPS
-            assert constants['SWIPE_THRESHOLD'] == 100  # DEFAULT_SWIPE_THRESHOLD
-            assert constants['UPDATE_INTERVAL'] == 300  # DEFAULT_UPDATE_INTERVAL
-            assert constants['SYSTEM_UPDATE_INTERVAL'] == 5  # DEFAULT_SYSTEM_UPDATE_INTERVAL
-            assert constants['DEBUG_MODE'] is False 
\ No newline at end of file
+        # Should use default values when no config provided
+        assert constants['FPS'] == 30  # DEFAULT_FPS
+        assert constants['SWIPE_THRESHOLD'] == 100  # DEFAULT_SWIPE_THRESHOLD
+        assert constants['UPDATE_INTERVAL'] == 300  # DEFAULT_UPDATE_INTERVAL
+        assert constants['SYSTEM_UPDATE_INTERVAL'] == 5  # DEFAULT_SYSTEM_UPDATE_INTERVAL
+        assert constants['DEBUG_MODE'] is False 
\ No newline at end of file
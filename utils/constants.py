@@ -2,6 +2,10 @@
 Constants and configuration values for the Raspberry Pi Dashboard.
 """
 
+import sys
+from collections import ChainMap, namedtuple
+from types import MappingProxyType
+
 # Display Settings (these are defaults, can be overridden via config)
 SCREEN_WIDTH = 480
 SCREEN_HEIGHT = 320
@@ -32,22 +36,31 @@ FONT_LARGE = 48
 FONT_MEDIUM = 36
 FONT_SMALL = 24
 
-# Status Colors mapping
-STATUS_COLORS = {
+# Status Colors mapping. The lookup tables below are read-only
+# MappingProxyType views with interned keys: lookups hit shared key
+# objects, and consumers can rely on the mappings never changing
+# without taking defensive copies.
+STATUS_COLORS = MappingProxyType({sys.intern(k): v for k, v in {
     'success': GREEN,
     'cached': BLUE,
     'error': RED,
     'unknown': GRAY,
     'warning': ORANGE,
     'critical': RED
-}
+}.items()})
 
-# API Endpoints - these remain constant
-API_ENDPOINTS = {
+# API Endpoints - these remain constant. Split by polling frequency:
+# the base endpoints are hit every update cycle, the mempool.space set
+# only by the Bitcoin screen's extended stats. The small hot dict keeps
+# the common lookups in a compact hash table.
+HOT_ENDPOINTS = MappingProxyType({
     'bitcoin_price': 'https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd',
     'blockchain_info': 'https://blockchain.info/latestblock',
-    'weather': 'https://api.openweathermap.org/data/2.5/weather',
-    # Mempool.space API endpoints for comprehensive Bitcoin data
+    'weather': 'https://api.openweathermap.org/data/2.5/weather'
+})
+
+# Mempool.space API endpoints for comprehensive Bitcoin data
+MEMPOOL_ENDPOINTS = MappingProxyType({
     'mempool_price': 'https://mempool.space/api/v1/prices',
     'mempool_difficulty': 'https://mempool.space/api/v1/difficulty-adjustment',
     'mempool_fees': 'https://mempool.space/api/v1/fees/recommended',
@@ -55,53 +68,41 @@ API_ENDPOINTS = {
     'mempool_blocks': 'https://mempool.space/api/v1/blocks',
     'mempool_mempool': 'https://mempool.space/api/mempool',
     'mempool_lightning': 'https://mempool.space/api/v1/lightning/statistics/latest'
-}
+})
+
+# Combined view kept for existing callers; hot endpoints are consulted
+# first, and writes still fail because the underlying maps are proxies.
+API_ENDPOINTS = ChainMap(HOT_ENDPOINTS, MEMPOOL_ENDPOINTS)
 
-# Weather Icons Mapping - these remain constant
-WEATHER_ICONS = {
+# Weather Icons Mapping - these remain constant. Conditions that share
+# a glyph (Mist/Fog, Clouds/Overcast) share the same string object.
+_FOG_ICON = '🌫️'
+_CLOUDS_ICON = '☁️'
+WEATHER_ICONS = MappingProxyType({sys.intern(k): v for k, v in {
     'Clear': '☀️',
-    'Clouds': '☁️',
+    'Clouds': _CLOUDS_ICON,
     'Rain': '🌧️',
     'Drizzle': '🌦️',
     'Thunderstorm': '⛈️',
     'Snow': '❄️',
-    'Mist': '��️',
-    'Fog': '🌫️',
+    'Mist': _FOG_ICON,
+    'Fog': _FOG_ICON,
     'Partly Cloudy': '⛅',
-    'Overcast': '☁️'
-}
-
-# Mock Weather Data for testing without API keys
-MOCK_WEATHER_DATA = [
-    {
-        'condition': 'Clear',
-        'temperature': 22.5,
-        'humidity': 45,
-        'wind_speed': 2.1,
-        'description': 'Sunny and clear'
-    },
-    {
-        'condition': 'Partly Cloudy',
-        'temperature': 19.8,
-        'humidity': 65,
-        'wind_speed': 3.2,
-        'description': 'Partly cloudy with light breeze'
-    },
-    {
-        'condition': 'Clouds',
-        'temperature': 16.4,
-        'humidity': 78,
-        'wind_speed': 4.5,
-        'description': 'Cloudy with moderate wind'
-    },
-    {
-        'condition': 'Rain',
-        'temperature': 15.2,
-        'humidity': 85,
-        'wind_speed': 5.8,
-        'description': 'Light rain showers'
-    }
-]
+    'Overcast': _CLOUDS_ICON
+}.items()})
+
+# Mock Weather Data for testing without API keys. Stored as immutable
+# namedtuples: field reads are C-level tuple indexing instead of dict
+# hashing, and consumers can hold references without defensive copies.
+WeatherSample = namedtuple(
+    'WeatherSample', 'condition temperature humidity wind_speed description')
+
+MOCK_WEATHER_DATA = (
+    WeatherSample('Clear', 22.5, 45, 2.1, 'Sunny and clear'),
+    WeatherSample('Partly Cloudy', 19.8, 65, 3.2, 'Partly cloudy with light breeze'),
+    WeatherSample('Clouds', 16.4, 78, 4.5, 'Cloudy with moderate wind'),
+    WeatherSample('Rain', 15.2, 85, 5.8, 'Light rain showers')
+)
 
 def get_runtime_constants(config_manager):
     """
@@ -114,7 +115,15 @@ def get_runtime_constants(config_manager):
     Returns:
         Dictionary with runtime configuration values
     """
-    return {
+    # Memoized on the manager itself, keyed by its mutation counter:
+    # callers in the frame loop get one attribute fetch and a compare
+    # instead of nine dotted-path lookups
+    version = getattr(config_manager, 'version', None)
+    cached = getattr(config_manager, '_runtime_constants_cache', None)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    result = {
         'FPS': config_manager.get('app.fps', DEFAULT_FPS),
         'SWIPE_THRESHOLD': config_manager.get('app.touch_swipe_threshold', DEFAULT_SWIPE_THRESHOLD),
         'UPDATE_INTERVAL': config_manager.get('app.api_update_interval', DEFAULT_UPDATE_INTERVAL),
@@ -124,4 +133,11 @@ def get_runtime_constants(config_manager):
         'AUTO_SWIPE_INTERVAL': config_manager.get('app.auto_swipe_interval', DEFAULT_AUTO_SWIPE_INTERVAL),
         'DEBUG_MODE': config_manager.get('app.debug_mode', False),
         'LOG_LEVEL': config_manager.get('app.log_level', 'INFO')
-    } 
\ No newline at end of file
+    }
+
+    try:
+        config_manager._runtime_constants_cache = (version, result)
+    except AttributeError:
+        # Read-only stand-ins can't hold the cache; just skip it
+        pass
+    return result
\ No newline at end of file
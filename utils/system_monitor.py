@@ -2,22 +2,224 @@
 System monitoring utilities for Raspberry Pi hardware statistics.
 """
 
+import asyncio
+import atexit
+import datetime
+import functools
+import os
 import psutil
+import re
+import threading
 import time
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
+# Prime psutil's per-process CPU-times bookkeeping so later
+# cpu_percent(interval=None) calls return immediately with the usage
+# since the previous call instead of blocking for a sampling window.
+try:
+    psutil.cpu_percent(interval=None)
+except Exception:
+    pass
+
+# Persistent fd for the thermal zone: os.pread on it replaces the
+# open/fstat/read/close syscall chain on every temperature sample.
+# None on systems without the sysfs node (non-Pi hardware, containers).
+try:
+    _TEMP_FD = os.open('/sys/class/thermal/thermal_zone0/temp', os.O_RDONLY)
+    atexit.register(os.close, _TEMP_FD)
+except OSError:
+    _TEMP_FD = None
+
+# Persistent fd + precompiled pattern for /proc/meminfo: one pread and
+# one regex match replace psutil's line-by-line readline pass and full
+# namedtuple construction per memory poll.
+try:
+    _MEMINFO_FD = os.open('/proc/meminfo', os.O_RDONLY)
+    atexit.register(os.close, _MEMINFO_FD)
+except OSError:
+    _MEMINFO_FD = None
+
+_MEMINFO_RE = re.compile(rb'MemTotal:\s+(\d+).*?MemAvailable:\s+(\d+)', re.S)
+
+# Persistent fd for /proc/net/dev; the counters for all interfaces are
+# summed from one pread instead of psutil's per-interface namedtuples.
+try:
+    _NETDEV_FD = os.open('/proc/net/dev', os.O_RDONLY)
+    atexit.register(os.close, _NETDEV_FD)
+except OSError:
+    _NETDEV_FD = None
+
+# Persistent fd for /proc/stat plus the previous sample, used to derive
+# the global CPU percentage from aggregate-line deltas without psutil's
+# per-CPU scan.
+try:
+    _STAT_FD = os.open('/proc/stat', os.O_RDONLY)
+    atexit.register(os.close, _STAT_FD)
+except OSError:
+    _STAT_FD = None
+
+_prev_cpu_busy = 0
+_prev_cpu_total = 0
+
+# Last rendered uptime, keyed by minute bucket: the broken-down fields
+# and the formatted string only change once per minute, so under 1 Hz
+# polling ~59 of 60 calls reuse the previous rendering.
+_last_uptime_min = -1
+_last_uptime_fmt = ''
+_last_uptime_parts = (0, 0, 0)
+
+
+def _cpu_percent_procfs() -> float:
+    """
+    Global CPU usage percent from /proc/stat.
+
+    Reads only the aggregate 'cpu' line and computes the busy share of
+    the jiffies elapsed since the previous call, mirroring
+    cpu_percent(interval=None) semantics without summing per-CPU rows.
+
+    Returns:
+        CPU usage percentage (0-100); 0.0 on the first call
+    """
+    global _prev_cpu_busy, _prev_cpu_total
+    data = os.pread(_STAT_FD, 256, 0)
+    fields = [int(x) for x in data[:data.index(b'\n')].split()[1:8]]
+    total = sum(fields)
+    idle = fields[3] + fields[4]
+    busy = total - idle
+    delta_total = total - _prev_cpu_total
+    delta_busy = busy - _prev_cpu_busy
+    _prev_cpu_total, _prev_cpu_busy = total, busy
+    if delta_total <= 0:
+        return 0.0
+    return round(delta_busy * 100.0 / delta_total, 1)
+
+# Unit-conversion factors hoisted to module scope; multiplying by the
+# reciprocal is cheaper than dividing and avoids re-evaluating the
+# power-of-two constant in every getter.
+_INV_GB = 1.0 / (1 << 30)
+_INV_MB = 1.0 / (1 << 20)
+
+# Zeroed fallback payloads, built once and handed out by reference on
+# the error paths instead of allocating a fresh dict per failure.
+# MappingProxyType keeps the shared instances safe against mutation.
+_ZERO_MEM = MappingProxyType({
+    'total': 0, 'available': 0, 'used': 0, 'percent': 0,
+    'total_gb': 0, 'used_gb': 0, 'available_gb': 0
+})
+_ZERO_DISK = MappingProxyType({
+    'total': 0, 'used': 0, 'free': 0, 'percent': 0,
+    'total_gb': 0, 'used_gb': 0, 'free_gb': 0
+})
+_ZERO_NET = MappingProxyType({
+    'bytes_sent': 0, 'bytes_recv': 0, 'packets_sent': 0, 'packets_recv': 0,
+    'mb_sent': 0, 'mb_recv': 0
+})
+_ZERO_UPTIME = MappingProxyType({
+    'total_seconds': 0, 'days': 0, 'hours': 0, 'minutes': 0,
+    'formatted': '0h 0m'
+})
+
+# Short-lived results of the poll-style getters, keyed by metric name.
+# Each entry is (monotonic timestamp, value).
+_stats_cache: Dict[str, tuple] = {}
+
+# Per-metric refresh windows in seconds; fast-moving metrics and the
+# slow-moving disk figure run on separate cadences (see
+# SystemMonitor.configure_cadence).
+_TTLS = {
+    'cpu_usage': 1.0,
+    'memory': 1.0,
+    'network': 1.0,
+    'disk': 5.0,
+    'complete': 0.5,
+}
+
+# Single-flight state for synchronous full collection: when several
+# threads miss the TTL cache in the same instant, exactly one (the
+# leader, which created _inflight_event) runs the pass; the rest wait
+# on the event and share _inflight_result.
+_inflight_lock = threading.Lock()
+_inflight_event: Optional[threading.Event] = None
+_inflight_result: Optional[Dict[str, Any]] = None
+
+
+def _ttl_cached(key: str):
+    """
+    Reuse a getter's previous return value within its _TTLS window.
+
+    The UI and health checks often poll faster than the underlying data
+    can meaningfully change; within the window a call collapses to a
+    dict lookup instead of redoing the psutil/procfs work.
+
+    Args:
+        key: Cache slot (and _TTLS entry) for the wrapped getter
+
+    Returns:
+        Decorator for a zero-argument callable
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper():
+            entry = _stats_cache.get(key)
+            now = time.monotonic()
+            if entry is not None and now - entry[0] < _TTLS[key]:
+                return entry[1]
+            value = fn()
+            _stats_cache[key] = (now, value)
+            return value
+        return wrapper
+    return decorator
+
 
 class SystemMonitor:
     """Monitor Raspberry Pi system statistics and hardware information."""
-    
+
+    # Background collector state; see start_collector(). _published is
+    # swapped atomically (plain attribute assignment) so readers never
+    # need a lock.
+    _collector_thread: Optional[threading.Thread] = None
+    _collector_interval = 1.0
+    _published: Optional[Dict[str, Any]] = None
+
+    # Diagnostic summary of what import-time probing found: 'procfs'
+    # when every hot getter has its fast-path fd, 'psutil' when none
+    # opened, 'mixed' otherwise. Each getter still picks its own path
+    # per call; this just says which one a given host will mostly use.
+    backend = ('procfs' if None not in (_STAT_FD, _MEMINFO_FD, _NETDEV_FD)
+               else 'psutil' if (_STAT_FD, _MEMINFO_FD, _NETDEV_FD) == (None, None, None)
+               else 'mixed')
+
+    # Health thresholds as (stats key, limit, severity, message) rows.
+    # Nested values use a 'parent.child' key. Built once at class
+    # creation so get_health_status() only walks a tuple per call.
+    _THRESHOLDS = (
+        ('cpu_temperature', 80, 'critical', 'Critical CPU temperature: {:.1f}°C'),
+        ('cpu_temperature', 70, 'warning', 'High CPU temperature: {:.1f}°C'),
+        ('cpu_usage', 90, 'warning', 'High CPU usage: {:.1f}%'),
+        ('memory.percent', 90, 'critical', 'Critical memory usage: {:.1f}%'),
+        ('memory.percent', 80, 'warning', 'High memory usage: {:.1f}%'),
+        ('disk.percent', 95, 'critical', 'Critical disk usage: {:.1f}%'),
+        ('disk.percent', 85, 'warning', 'High disk usage: {:.1f}%'),
+    )
+
     @staticmethod
     def get_cpu_temperature() -> float:
         """
         Get CPU temperature in Celsius.
-        
+
+        Reads the persistent thermal-zone fd with a single pread,
+        parsing straight from bytes; falls back to a regular open()
+        when the fd could not be acquired at import.
+
         Returns:
             CPU temperature in Celsius or 0.0 if unavailable
         """
+        if _TEMP_FD is not None:
+            try:
+                return int(os.pread(_TEMP_FD, 32, 0).strip()) / 1000.0
+            except (OSError, ValueError):
+                return 0.0
         try:
             with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
                 temp = float(f.read().strip()) / 1000.0
@@ -27,26 +229,61 @@ class SystemMonitor:
             return 0.0
     
     @staticmethod
+    @_ttl_cached('cpu_usage')
     def get_cpu_usage() -> float:
         """
         Get current CPU usage percentage.
-        
+
+        Non-blocking: reports usage since the previous call rather than
+        sampling for a fixed window, so get_complete_stats() no longer
+        stalls for a full second on this. The first call after import
+        can read 0.0. On Linux the figure comes from the /proc/stat
+        aggregate line; elsewhere psutil provides it.
+
         Returns:
             CPU usage percentage (0-100)
         """
+        if _STAT_FD is not None:
+            try:
+                return _cpu_percent_procfs()
+            except (OSError, ValueError, IndexError):
+                return 0.0
         try:
-            return psutil.cpu_percent(interval=1)
+            return psutil.cpu_percent(interval=None)
         except Exception:
             return 0.0
     
     @staticmethod
+    @_ttl_cached('memory')
     def get_memory_info() -> Dict[str, Any]:
         """
         Get memory usage information.
-        
+
+        On Linux this reads /proc/meminfo directly (single pread, one
+        regex match for MemTotal/MemAvailable); 'used' is computed as
+        total minus available, which is what the dashboard displays.
+        Falls back to psutil elsewhere.
+
         Returns:
             Dictionary with memory statistics
         """
+        if _MEMINFO_FD is not None:
+            try:
+                match = _MEMINFO_RE.search(os.pread(_MEMINFO_FD, 8192, 0))
+                total = int(match.group(1)) * 1024
+                available = int(match.group(2)) * 1024
+                used = total - available
+                return {
+                    'total': total,
+                    'available': available,
+                    'used': used,
+                    'percent': round(used * 100.0 / total, 1) if total else 0,
+                    'total_gb': total * _INV_GB,
+                    'used_gb': used * _INV_GB,
+                    'available_gb': available * _INV_GB
+                }
+            except (OSError, AttributeError, ValueError):
+                pass  # malformed or unreadable; fall back to psutil
         try:
             memory = psutil.virtual_memory()
             return {
@@ -54,78 +291,137 @@ class SystemMonitor:
                 'available': memory.available,
                 'used': memory.used,
                 'percent': memory.percent,
-                'total_gb': memory.total / (1024**3),
-                'used_gb': memory.used / (1024**3),
-                'available_gb': memory.available / (1024**3)
-            }
-        except Exception:
-            return {
-                'total': 0, 'available': 0, 'used': 0, 'percent': 0,
-                'total_gb': 0, 'used_gb': 0, 'available_gb': 0
+                'total_gb': memory.total * _INV_GB,
+                'used_gb': memory.used * _INV_GB,
+                'available_gb': memory.available * _INV_GB
             }
+        except OSError:
+            return _ZERO_MEM
     
     @staticmethod
+    @_ttl_cached('disk')
     def get_disk_info() -> Dict[str, Any]:
         """
         Get disk usage information for root partition.
-        
+
+        Calls os.statvfs directly — one syscall, no namedtuple wrapping
+        or mount-table scans. 'free' is the space available to
+        unprivileged users (f_bavail), matching what df reports.
+
         Returns:
             Dictionary with disk statistics
         """
         try:
-            disk = psutil.disk_usage('/')
-            return {
-                'total': disk.total,
-                'used': disk.used,
-                'free': disk.free,
-                'percent': (disk.used / disk.total) * 100,
-                'total_gb': disk.total / (1024**3),
-                'used_gb': disk.used / (1024**3),
-                'free_gb': disk.free / (1024**3)
-            }
-        except Exception:
+            fs = os.statvfs('/')
+            total = fs.f_blocks * fs.f_frsize
+            free = fs.f_bavail * fs.f_frsize
+            used = total - free
             return {
-                'total': 0, 'used': 0, 'free': 0, 'percent': 0,
-                'total_gb': 0, 'used_gb': 0, 'free_gb': 0
+                'total': total,
+                'used': used,
+                'free': free,
+                'percent': (used * 100.0 / total) if total else 0.0,
+                'total_gb': total * _INV_GB,
+                'used_gb': used * _INV_GB,
+                'free_gb': free * _INV_GB
             }
+        except OSError:
+            return _ZERO_DISK
     
     @staticmethod
     def get_uptime() -> Dict[str, Any]:
         """
         Get system uptime information.
-        
+
+        The day/hour/minute breakdown and the formatted string are
+        recomputed only when the minute rolls over; in between, calls
+        reuse the previous rendering with a fresh total_seconds.
+
         Returns:
             Dictionary with uptime statistics
         """
+        global _last_uptime_min, _last_uptime_fmt, _last_uptime_parts
         try:
             boot_time = psutil.boot_time()
             uptime_seconds = time.time() - boot_time
-            
-            days = int(uptime_seconds // 86400)
-            hours = int((uptime_seconds % 86400) // 3600)
-            minutes = int((uptime_seconds % 3600) // 60)
-            
+
+            total_min = int(uptime_seconds) // 60
+            if total_min != _last_uptime_min:
+                days, hm = divmod(total_min, 1440)
+                hours, minutes = divmod(hm, 60)
+                _last_uptime_parts = (days, hours, minutes)
+                _last_uptime_fmt = (f"{days}d {hours}h {minutes}m" if days > 0
+                                    else f"{hours}h {minutes}m")
+                _last_uptime_min = total_min
+
+            days, hours, minutes = _last_uptime_parts
             return {
                 'total_seconds': uptime_seconds,
                 'days': days,
                 'hours': hours,
                 'minutes': minutes,
-                'formatted': f"{days}d {hours}h {minutes}m" if days > 0 else f"{hours}h {minutes}m"
-            }
-        except Exception:
-            return {
-                'total_seconds': 0, 'days': 0, 'hours': 0, 'minutes': 0,
-                'formatted': '0h 0m'
+                'formatted': _last_uptime_fmt
             }
+        except OSError:
+            return _ZERO_UPTIME
     
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def format_uptime(seconds: int) -> str:
+        """
+        Format an uptime in seconds as H:MM:SS (with a day count when
+        over 24h).
+
+        Results are memoized: callers formatting the same whole-second
+        value repeatedly (several frames land within one uptime tick)
+        pay for the timedelta construction and stringification once.
+
+        Args:
+            seconds: Uptime in whole seconds
+
+        Returns:
+            Formatted uptime string, e.g. '1 day, 0:00:00'
+        """
+        return str(datetime.timedelta(seconds=seconds))
+
+    @staticmethod
+    @_ttl_cached('network')
     def get_network_info() -> Dict[str, Any]:
         """
         Get network interface information.
-        
+
+        On Linux the counters come from one pread of /proc/net/dev,
+        summed across real interfaces (loopback excluded) without
+        per-interface namedtuple construction. psutil is the fallback
+        elsewhere; note it includes loopback in its totals.
+
         Returns:
             Dictionary with network statistics
         """
+        if _NETDEV_FD is not None:
+            try:
+                data = os.pread(_NETDEV_FD, 16384, 0)
+                bytes_recv = packets_recv = bytes_sent = packets_sent = 0
+                # First two lines are column headers
+                for line in data.split(b'\n')[2:]:
+                    iface, sep, counters = line.partition(b':')
+                    if not sep or iface.strip() == b'lo':
+                        continue
+                    fields = counters.split()
+                    bytes_recv += int(fields[0])
+                    packets_recv += int(fields[1])
+                    bytes_sent += int(fields[8])
+                    packets_sent += int(fields[9])
+                return {
+                    'bytes_sent': bytes_sent,
+                    'bytes_recv': bytes_recv,
+                    'packets_sent': packets_sent,
+                    'packets_recv': packets_recv,
+                    'mb_sent': bytes_sent * _INV_MB,
+                    'mb_recv': bytes_recv * _INV_MB
+                }
+            except (OSError, ValueError, IndexError):
+                pass  # unreadable or unexpected layout; use psutil
         try:
             net_io = psutil.net_io_counters()
             return {
@@ -133,83 +429,207 @@ class SystemMonitor:
                 'bytes_recv': net_io.bytes_recv,
                 'packets_sent': net_io.packets_sent,
                 'packets_recv': net_io.packets_recv,
-                'mb_sent': net_io.bytes_sent / (1024**2),
-                'mb_recv': net_io.bytes_recv / (1024**2)
-            }
-        except Exception:
-            return {
-                'bytes_sent': 0, 'bytes_recv': 0, 'packets_sent': 0, 'packets_recv': 0,
-                'mb_sent': 0, 'mb_recv': 0
+                'mb_sent': net_io.bytes_sent * _INV_MB,
+                'mb_recv': net_io.bytes_recv * _INV_MB
             }
+        except OSError:
+            return _ZERO_NET
     
     @staticmethod
+    def _collect_stats() -> Dict[str, Any]:
+        """Run one synchronous collection pass over all metrics.
+
+        Returns:
+            A fresh dictionary with every metric
+        """
+        # No blanket try here: every getter already degrades to a
+        # zeroed payload on the failures it can actually hit, and a
+        # genuinely unexpected exception should surface rather than
+        # be flattened into a {'status': 'error'} dict.
+        return {
+            'cpu_temperature': SystemMonitor.get_cpu_temperature(),
+            'cpu_usage': SystemMonitor.get_cpu_usage(),
+            'memory': SystemMonitor.get_memory_info(),
+            'disk': SystemMonitor.get_disk_info(),
+            'uptime': SystemMonitor.get_uptime(),
+            'network': SystemMonitor.get_network_info(),
+            'timestamp': time.time(),
+            'status': 'success'
+        }
+
+    @classmethod
+    def configure_cadence(cls, fast: float = 1.0, slow: float = 30.0) -> None:
+        """
+        Set the refresh cadences for fast- and slow-moving metrics.
+
+        CPU usage, memory and network counters change by the second;
+        root-filesystem usage barely moves over minutes on an
+        appliance. Splitting the cadences means the slow metrics skip
+        almost all of their statvfs/procfs work during steady polling.
+
+        Args:
+            fast: Seconds between refreshes of CPU/memory/network
+            slow: Seconds between refreshes of disk usage
+        """
+        cls._collector_interval = fast
+        _TTLS['cpu_usage'] = _TTLS['memory'] = _TTLS['network'] = fast
+        _TTLS['complete'] = fast / 2.0
+        _TTLS['disk'] = slow
+
+    @classmethod
+    def start_collector(cls, interval: float = 1.0) -> None:
+        """
+        Start the background stats collector (idempotent).
+
+        A single daemon thread refreshes a read-only snapshot every
+        interval seconds; once it is running, get_complete_stats()
+        returns the latest snapshot instead of collecting
+        synchronously, so the cost per reader is one attribute fetch
+        regardless of how many callers poll.
+
+        Args:
+            interval: Seconds between collection passes (also becomes
+                the fast cadence; see configure_cadence)
+        """
+        if cls._collector_thread is not None and cls._collector_thread.is_alive():
+            return
+        cls.configure_cadence(fast=interval)
+        cls._collector_thread = threading.Thread(
+            target=cls._collect_loop,
+            daemon=True,
+            name='system-stats-collector'
+        )
+        cls._collector_thread.start()
+
+    @classmethod
+    def _collect_loop(cls) -> None:
+        """Collector thread body: refresh the published snapshot forever.
+
+        Each tick publishes a view over a fresh dict: consumers cache
+        the returned snapshot across ticks (SystemStatsScreen holds one
+        for its whole update interval), so a published mapping must
+        never be mutated afterwards. One small dict per tick is the
+        price of that immutability.
+        """
+        while True:
+            cls._published = MappingProxyType(cls._collect_stats())
+            time.sleep(cls._collector_interval)
+
+    @staticmethod
+    @_ttl_cached('complete')
     def get_complete_stats() -> Dict[str, Any]:
         """
         Get complete system statistics.
-        
+
+        Returns the background collector's snapshot when the collector
+        is running (a read-only mapping), otherwise collects
+        synchronously. Synchronous collection is single-flight: when
+        several threads miss the TTL cache together, one collects and
+        the others wait for its result rather than duplicating the
+        whole pass.
+
         Returns:
-            Dictionary with all system information
+            Mapping with all system information
         """
+        published = SystemMonitor._published
+        if published is not None:
+            return published
+
+        global _inflight_event, _inflight_result
+        with _inflight_lock:
+            event = _inflight_event
+            if event is None:
+                # Becoming the leader: clear the previous round's
+                # result so joiners can tell success from failure.
+                _inflight_event = my_event = threading.Event()
+                _inflight_result = None
+        if event is not None:
+            # Join the in-progress pass and reuse the leader's result.
+            event.wait()
+            result = _inflight_result
+            if result is not None:
+                return result
+            # Leader failed before publishing; collect independently.
+            return SystemMonitor._collect_stats()
         try:
-            return {
-                'cpu_temperature': SystemMonitor.get_cpu_temperature(),
-                'cpu_usage': SystemMonitor.get_cpu_usage(),
-                'memory': SystemMonitor.get_memory_info(),
-                'disk': SystemMonitor.get_disk_info(),
-                'uptime': SystemMonitor.get_uptime(),
-                'network': SystemMonitor.get_network_info(),
-                'timestamp': time.time(),
-                'status': 'success'
-            }
-        except Exception as e:
-            return {
-                'status': 'error',
-                'error': str(e),
-                'timestamp': time.time()
-            }
-    
+            result = SystemMonitor._collect_stats()
+            _inflight_result = result
+        finally:
+            with _inflight_lock:
+                _inflight_event = None
+            my_event.set()
+        return result
+
+    @staticmethod
+    async def get_complete_stats_async() -> Dict[str, Any]:
+        """
+        Collect complete system statistics without blocking the loop.
+
+        Runs the six getters concurrently on worker threads via
+        asyncio.gather, so total latency is roughly the slowest
+        individual probe rather than their sum. For asyncio-based
+        callers; the pygame loop keeps using get_complete_stats().
+
+        Returns:
+            Dictionary with all system information
+        """
+        (cpu_temp, cpu_usage, memory, disk,
+         uptime, network) = await asyncio.gather(
+            asyncio.to_thread(SystemMonitor.get_cpu_temperature),
+            asyncio.to_thread(SystemMonitor.get_cpu_usage),
+            asyncio.to_thread(SystemMonitor.get_memory_info),
+            asyncio.to_thread(SystemMonitor.get_disk_info),
+            asyncio.to_thread(SystemMonitor.get_uptime),
+            asyncio.to_thread(SystemMonitor.get_network_info),
+        )
+        return {
+            'cpu_temperature': cpu_temp,
+            'cpu_usage': cpu_usage,
+            'memory': memory,
+            'disk': disk,
+            'uptime': uptime,
+            'network': network,
+            'timestamp': time.time(),
+            'status': 'success'
+        }
+
     @staticmethod
-    def get_health_status() -> Dict[str, Any]:
+    def get_health_status(stats: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Get system health status with warnings.
-        
+
+        Args:
+            stats: Optional stats mapping from get_complete_stats();
+                callers that just collected one pass it in to skip the
+                second lookup per frame
+
         Returns:
             Dictionary with health information and warnings
         """
-        stats = SystemMonitor.get_complete_stats()
-        
+        if stats is None:
+            stats = SystemMonitor.get_complete_stats()
+
         if stats['status'] == 'error':
             return stats
-        
+
         warnings = []
         critical = []
-        
-        # CPU temperature checks
-        cpu_temp = stats['cpu_temperature']
-        if cpu_temp > 80:
-            critical.append(f"Critical CPU temperature: {cpu_temp:.1f}°C")
-        elif cpu_temp > 70:
-            warnings.append(f"High CPU temperature: {cpu_temp:.1f}°C")
-        
-        # CPU usage checks
-        cpu_usage = stats['cpu_usage']
-        if cpu_usage > 90:
-            warnings.append(f"High CPU usage: {cpu_usage:.1f}%")
-        
-        # Memory usage checks
-        memory_percent = stats['memory']['percent']
-        if memory_percent > 90:
-            critical.append(f"Critical memory usage: {memory_percent:.1f}%")
-        elif memory_percent > 80:
-            warnings.append(f"High memory usage: {memory_percent:.1f}%")
-        
-        # Disk usage checks
-        disk_percent = stats['disk']['percent']
-        if disk_percent > 95:
-            critical.append(f"Critical disk usage: {disk_percent:.1f}%")
-        elif disk_percent > 85:
-            warnings.append(f"High disk usage: {disk_percent:.1f}%")
-        
+
+        # Scan the threshold ladder; rows for the same metric are
+        # ordered most-severe first and only the first hit per metric
+        # is reported, so the message string is only built when a
+        # threshold actually fires.
+        fired = set()
+        for key, limit, severity, template in SystemMonitor._THRESHOLDS:
+            if key in fired:
+                continue
+            head, _, tail = key.partition('.')
+            value = stats[head][tail] if tail else stats[head]
+            if value > limit:
+                target = critical if severity == 'critical' else warnings
+                target.append(template.format(value))
+                fired.add(key)
+
         # Determine overall health
         if critical:
             health_status = 'critical'
@@ -218,25 +638,41 @@ class SystemMonitor:
         else:
             health_status = 'good'
         
-        stats.update({
+        # Copy before annotating: the stats mapping may be the
+        # collector's read-only snapshot (and the cached dict must not
+        # grow health keys as a side effect)
+        result = dict(stats)
+        result.update({
             'health_status': health_status,
             'warnings': warnings,
             'critical': critical
         })
-        
-        return stats
+
+        return result
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def is_raspberry_pi() -> bool:
         """
         Check if running on a Raspberry Pi.
-        
+
+        The hardware cannot change while the process runs, so the probe
+        happens once and every later call is a cache lookup. The
+        device-tree model string (~30 bytes) is checked first; the
+        fallback reads only the first 512 bytes of /proc/cpuinfo, which
+        cover the Model/Hardware lines without pulling per-core blocks.
+
         Returns:
             True if running on Raspberry Pi, False otherwise
         """
-        try:
-            with open('/proc/cpuinfo', 'r') as f:
-                cpuinfo = f.read()
-                return 'Raspberry Pi' in cpuinfo
-        except (FileNotFoundError, PermissionError):
-            return False 
\ No newline at end of file
+        for path in ('/proc/device-tree/model', '/proc/cpuinfo'):
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, 'r') as f:
+                    head = f.read(512)
+            except (OSError, UnicodeDecodeError):
+                continue
+            if 'Raspberry Pi' in head or 'BCM2' in head:
+                return True
+        return False 
\ No newline at end of file